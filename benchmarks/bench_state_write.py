@@ -0,0 +1,249 @@
+"""Microbenchmark of the MelView entity state-write path.
+
+Builds hundreds of climate, Lossnay fan and sensor entities over synthetic
+coordinator data and times the properties Home Assistant evaluates on
+every state write. Reports per-property cost, allocations retained per
+call and peak transient memory, plus the cost of Home Assistant's full
+state calculation (``Entity._async_calculate_state``) per write.
+
+Run from the repository root with Home Assistant installed:
+
+    python benchmarks/bench_state_write.py --units 500
+    python benchmarks/bench_state_write.py --units 200 --json > bench_output.txt
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import operator
+import random
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from homeassistant.util.unit_system import METRIC_SYSTEM  # noqa: E402
+
+from custom_components.melview.climate import MelViewClimate  # noqa: E402
+from custom_components.melview.fan import MelViewLossnayFan  # noqa: E402
+from custom_components.melview.melview import MelViewDevice  # noqa: E402
+from custom_components.melview.sensor import (  # noqa: E402
+    MelViewCoreEfficiencySensor,
+    MelViewCurrentTempSensor,
+    MelViewExhaustTempSensor,
+    MelViewOutdoorTempSensor,
+    MelViewSupplyTempSensor,
+)
+
+PROPERTIES = {
+    MelViewClimate: (
+        "state",
+        "hvac_mode",
+        "supported_features",
+        "min_temp",
+        "max_temp",
+        "hvac_action",
+        "fan_mode",
+        "current_temperature",
+        "target_temperature",
+        "capability_attributes",
+        "state_attributes",
+        "extra_state_attributes",
+    ),
+    MelViewLossnayFan: (
+        "is_on",
+        "percentage",
+        "speed_count",
+        "preset_mode",
+        "supported_features",
+        "capability_attributes",
+        "state_attributes",
+        "extra_state_attributes",
+    ),
+}
+SENSOR_PROPERTIES = (
+    "native_value",
+    "state",
+    "capability_attributes",
+    "extra_state_attributes",
+)
+for sensor_cls in (
+    MelViewCurrentTempSensor,
+    MelViewOutdoorTempSensor,
+    MelViewSupplyTempSensor,
+    MelViewExhaustTempSensor,
+    MelViewCoreEfficiencySensor,
+):
+    PROPERTIES[sensor_cls] = SENSOR_PROPERTIES
+
+# Just enough of HomeAssistant for unit-aware state and attribute getters.
+STUB_HASS = SimpleNamespace(config=SimpleNamespace(units=METRIC_SYSTEM))
+
+TEMP_RANGES = {str(mode): {"min": 16, "max": 31} for mode in (1, 2, 3, 7, 8)}
+
+
+class StubCoordinator:
+    """Just enough of MelViewCoordinator for entities to read from."""
+
+    def __init__(self, device: MelViewDevice) -> None:
+        self.device = device
+        self.data = device._json
+        self.stale = False
+        self.rolling = {}
+        self.last_update_success = True
+
+    def __getattr__(self, name):
+        return getattr(self.device, name)
+
+
+def _synthetic_device(unitid: int, erv: bool, rng: random.Random) -> MelViewDevice:
+    device = MelViewDevice(unitid, 1, f"Unit {unitid}", authentication=None)
+    caps = {
+        "unittype": "ERV" if erv else "RAC",
+        "fanstage": 3 if erv else 5,
+        "hasautofan": 0 if erv else 1,
+        "halfdeg": 1,
+        "hasoutdoortemp": 1,
+        "modelname": "BENCH",
+    }
+    if not erv:
+        caps["max"] = TEMP_RANGES
+    state = {
+        "power": rng.choice((0, 1)),
+        "standby": rng.choice((0, 1)),
+        "setmode": 1 if erv else rng.choice((1, 2, 3, 7, 8)),
+        "setfan": rng.choice((2, 3, 5)),
+        "settemp": str(rng.randint(18, 26)),
+        "roomtemp": str(round(rng.uniform(15, 28), 1)),
+        "outdoortemp": str(round(rng.uniform(5, 35), 1)),
+        "exhausttemp": str(round(rng.uniform(15, 28), 1)),
+        "coreefficiency": round(rng.uniform(0.6, 0.9), 2),
+        "fault": "",
+        "error": "ok",
+    }
+    device.restore(caps, state)
+    return device
+
+
+def build_entities(units: int, seed: int) -> dict[type, list]:
+    """Create entities for ``units`` synthetic units, one in ten an ERV."""
+    rng = random.Random(seed)
+    entities: dict[type, list] = {cls: [] for cls in PROPERTIES}
+    for unitid in range(units):
+        erv = unitid % 10 == 0
+        coordinator = StubCoordinator(_synthetic_device(unitid, erv, rng))
+        entities[MelViewCurrentTempSensor].append(
+            MelViewCurrentTempSensor(coordinator, rolling=True)
+        )
+        if erv:
+            entities[MelViewLossnayFan].append(MelViewLossnayFan(coordinator))
+            entities[MelViewOutdoorTempSensor].append(
+                MelViewOutdoorTempSensor(coordinator, rolling=True)
+            )
+            entities[MelViewSupplyTempSensor].append(
+                MelViewSupplyTempSensor(coordinator)
+            )
+            entities[MelViewExhaustTempSensor].append(
+                MelViewExhaustTempSensor(coordinator, rolling=True)
+            )
+            entities[MelViewCoreEfficiencySensor].append(
+                MelViewCoreEfficiencySensor(coordinator, rolling=True)
+            )
+        else:
+            entities[MelViewClimate].append(MelViewClimate(coordinator))
+    for group in entities.values():
+        for entity in group:
+            entity.hass = STUB_HASS
+    return entities
+
+
+def _calculate_state(entity):
+    return entity._async_calculate_state()
+
+
+def _time_call(entities: list, call: Callable, repeat: int) -> float:
+    """Return the best-of-``repeat`` cost of one evaluation, in nanoseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        for entity in entities:
+            call(entity)
+        best = min(best, time.perf_counter_ns() - start)
+    return best / len(entities)
+
+
+def _allocations(entities: list, call: Callable) -> tuple[float, float]:
+    """Return retained blocks per call and peak transient bytes per call."""
+    results = []
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    base, _ = tracemalloc.get_traced_memory()
+    for entity in entities:
+        results.append(call(entity))
+    _, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    return blocks / len(entities), (peak - base) / len(entities)
+
+
+def run(units: int, repeat: int, seed: int) -> list[dict]:
+    """Benchmark every property of every entity class, then a full write."""
+    rows = []
+    for cls, entities in build_entities(units, seed).items():
+        if not entities:
+            continue
+        calls = [(prop, operator.attrgetter(prop)) for prop in PROPERTIES[cls]]
+        # What Home Assistant evaluates for one state write, registry aside.
+        calls.append(("<state write>", _calculate_state))
+        for name, call in calls:
+            cost = _time_call(entities, call, repeat)
+            blocks, peak = _allocations(entities, call)
+            rows.append(
+                {
+                    "entity": cls.__name__,
+                    "property": name,
+                    "entities": len(entities),
+                    "ns_per_call": round(cost, 1),
+                    "blocks_per_call": round(blocks, 2),
+                    "peak_bytes_per_call": round(peak, 1),
+                }
+            )
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--units", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="Print JSON rows")
+    args = parser.parse_args()
+
+    # Property getters log at debug/error level; keep logging out of timings.
+    logging.disable(logging.CRITICAL)
+    rows = run(args.units, args.repeat, args.seed)
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return
+    print(
+        f"{'entity':<30} {'property':<24} {'n':>5} {'ns/call':>10} "
+        f"{'blocks':>8} {'peak B':>8}"
+    )
+    for row in rows:
+        print(
+            f"{row['entity']:<30} {row['property']:<24} {row['entities']:>5} "
+            f"{row['ns_per_call']:>10} {row['blocks_per_call']:>8} "
+            f"{row['peak_bytes_per_call']:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
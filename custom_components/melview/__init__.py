@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_EMAIL, CONF_PASSWORD, Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import (
     ConfigEntryAuthFailed,
     ConfigEntryError,
@@ -14,9 +15,25 @@ from homeassistant.exceptions import (
 )
 from homeassistant.helpers import device_registry as dr, issue_registry as ir
 
-from .const import CONF_LOCAL, CONF_SENSOR, DOMAIN
+from .command_queue import MelViewCommandQueue
+from .const import (
+    CONF_LOCAL,
+    CONF_QUEUE,
+    CONF_SENSOR,
+    CONF_STALE_THRESHOLD,
+    CONF_TELEMETRY,
+    DEFAULT_STALE_THRESHOLD,
+    DOMAIN,
+    MANUFACTURER,
+)
 from .coordinator import MelViewCoordinator
 from .melview import MelView, MelViewAuthentication
+from .services import async_setup_services
+from .snapshot import MelViewSnapshotStore
+from .startup import StartupProfiler
+from .telemetry import TelemetryWriter
+from .tracing import clear_traces
+from .watchdog import async_setup_watchdog
 
 type MelViewConfigEntry = ConfigEntry[list[MelViewCoordinator]]
 
@@ -24,6 +41,9 @@ _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS = [Platform.CLIMATE, Platform.SWITCH, Platform.SENSOR, Platform.FAN]
 
+# Units brought up concurrently during setup.
+FIRST_REFRESH_CONCURRENCY = 8
+
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up MelView; YAML is no longer supported (warn once if present)."""
@@ -36,6 +56,7 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
                 DOMAIN,
             )
             hass.data[DOMAIN]["_yaml_warned"] = True
+    async_setup_services(hass)
     return True
 
 
@@ -45,7 +66,43 @@ async def async_setup_entry(hass: HomeAssistant, entry: MelViewConfigEntry) -> b
     conf = entry.data
     options = entry.options
     mv_auth = MelViewAuthentication(conf[CONF_EMAIL], conf[CONF_PASSWORD])
-    result = await mv_auth.async_login()
+    melview = MelView(mv_auth, localcontrol=options.get(CONF_LOCAL))
+    snapshot = MelViewSnapshotStore(hass, entry.entry_id)
+    profiler = StartupProfiler(mv_auth)
+    hass.data.setdefault(DOMAIN, {}).setdefault("startup", {})[
+        entry.entry_id
+    ] = profiler
+
+    async with profiler.phase("snapshot"):
+        cached = await snapshot.async_load()
+    queue = None
+    if options.get(CONF_QUEUE, False):
+        queue = MelViewCommandQueue(hass, entry.entry_id)
+        await queue.async_load()
+    telemetry = None
+    if options.get(CONF_TELEMETRY, False):
+        telemetry = TelemetryWriter(
+            hass, hass.config.path("melview_telemetry", entry.entry_id)
+        )
+        telemetry.async_start()
+        entry.async_on_unload(telemetry.async_stop)
+    if stale_threshold := options.get(CONF_STALE_THRESHOLD, DEFAULT_STALE_THRESHOLD):
+        async_setup_watchdog(hass, entry, stale_threshold)
+    if cached:
+        return await _async_setup_from_snapshot(
+            hass,
+            entry,
+            melview,
+            mv_auth,
+            snapshot,
+            cached,
+            profiler,
+            queue,
+            telemetry,
+        )
+
+    async with profiler.phase("login"):
+        result = await mv_auth.async_login()
     if not result:
         _LOGGER.error("MelView authentication failed for %s", conf[CONF_EMAIL])
         ir.async_create_issue(
@@ -60,7 +117,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: MelViewConfigEntry) -> b
         )
         raise ConfigEntryAuthFailed
     _LOGGER.debug("Authentication successful")
-    melview = MelView(mv_auth, localcontrol=options.get(CONF_LOCAL))
 
     units = mv_auth.number_units()
     if units is False:
@@ -72,7 +128,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: MelViewConfigEntry) -> b
         raise ConfigEntryError("Account has no devices")
 
     _LOGGER.debug("Getting data")
-    devices = await melview.async_get_devices_list()
+    # Without a snapshot nothing is known about the units until this succeeds.
+    devices = await melview.async_get_devices_list(profiler=profiler)
     if not devices:
         _LOGGER.debug("Unable to retrieve device list")
         raise ConfigEntryNotReady("Unable to retrieve device list")
@@ -80,29 +137,154 @@ async def async_setup_entry(hass: HomeAssistant, entry: MelViewConfigEntry) -> b
     _cleanup_removed_devices(
         hass, entry, {str(device.get_id()) for device in devices}
     )
+    snapshot.async_set_rooms(devices)
 
+    device_registry = dr.async_get(hass)
     device_list = []
     for device in devices:
-        coordinator = MelViewCoordinator(hass, entry, device)
-        await coordinator.async_config_entry_first_refresh()
-        _LOGGER.debug("Device: %s", device.get_friendly_name())
-        device_list.append(coordinator)
+        # Register the unit up front so it is listed even before it responds.
+        device_registry.async_get_or_create(
+            config_entry_id=entry.entry_id,
+            identifiers={(DOMAIN, device.get_id())},
+            name=device.get_friendly_name(),
+            manufacturer=MANUFACTURER,
+        )
+        device_list.append(
+            MelViewCoordinator(hass, entry, device, snapshot, queue, telemetry)
+        )
     entry.runtime_data = device_list
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    async with profiler.phase("platforms"):
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     _LOGGER.debug("Set up coordinator(s): %s", entry.runtime_data)
+    entry.async_create_background_task(
+        hass,
+        _async_first_refresh(entry, profiler),
+        f"{DOMAIN}_first_refresh_{entry.entry_id}",
+    )
     return True
 
 
+async def _async_first_refresh(
+    entry: MelViewConfigEntry, profiler: StartupProfiler
+) -> None:
+    """Bring up each unit independently; entities appear as each is ready.
+
+    Setup timing is reported once every unit has made its first attempt, so
+    a unit that keeps failing does not hold back the summary.
+    """
+    semaphore = asyncio.Semaphore(FIRST_REFRESH_CONCURRENCY)
+    pending = len(entry.runtime_data)
+
+    @callback
+    def _async_attempted() -> None:
+        nonlocal pending
+        pending -= 1
+        if not pending:
+            profiler.finish()
+            _LOGGER.info("MelView setup for %s: %s", entry.title, profiler.summary())
+
+    async def _async_start(coordinator: MelViewCoordinator) -> None:
+        async with profiler.phase(
+            "first_refresh", coordinator.get_id(), source=coordinator.device
+        ):
+            await coordinator.async_start(semaphore, _async_attempted)
+
+    await asyncio.gather(*map(_async_start, entry.runtime_data))
+
+
+async def _async_setup_from_snapshot(
+    hass: HomeAssistant,
+    entry: MelViewConfigEntry,
+    melview: MelView,
+    mv_auth: MelViewAuthentication,
+    snapshot: MelViewSnapshotStore,
+    cached: dict[str, dict],
+    profiler: StartupProfiler,
+    queue: MelViewCommandQueue | None,
+    telemetry: TelemetryWriter | None,
+) -> bool:
+    """Set up entities from the last known state and revalidate in the background."""
+    device_list = []
+    # Units that never answered are set up as on a fresh start.
+    units = [cached.get(str(room["unitid"]), room) for room in snapshot.rooms]
+    for device in melview.restore_devices(units):
+        coordinator = MelViewCoordinator(
+            hass, entry, device, snapshot, queue, telemetry
+        )
+        if (unit := cached.get(str(device.get_id()))) is not None:
+            coordinator.async_restore(device._json, unit.get("updated"))
+        device_list.append(coordinator)
+    entry.runtime_data = device_list
+    async with profiler.phase("platforms"):
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    _LOGGER.debug("Set up %d unit(s) from state snapshot", len(device_list))
+
+    entry.async_create_background_task(
+        hass,
+        _async_revalidate(hass, entry, melview, mv_auth, snapshot, profiler),
+        f"{DOMAIN}_revalidate_{entry.entry_id}",
+    )
+    return True
+
+
+async def _async_revalidate(
+    hass: HomeAssistant,
+    entry: MelViewConfigEntry,
+    melview: MelView,
+    mv_auth: MelViewAuthentication,
+    snapshot: MelViewSnapshotStore,
+    profiler: StartupProfiler,
+) -> None:
+    """Log in, check the unit list and replace snapshot state with fresh data."""
+    try:
+        async with profiler.phase("login"):
+            result = await mv_auth.async_login()
+    except Exception as err:
+        _LOGGER.warning("MelView login failed, keeping last known state: %s", err)
+    else:
+        if not result:
+            _LOGGER.error(
+                "MelView authentication failed for %s", entry.data[CONF_EMAIL]
+            )
+            entry.async_start_reauth(hass)
+            return
+        devices = await melview.async_get_devices_list(profiler=profiler)
+        if devices is None:
+            _LOGGER.warning("Unable to retrieve device list, keeping last known state")
+        elif {str(device.get_id()) for device in devices} != {
+            str(room["unitid"]) for room in snapshot.rooms
+        }:
+            _LOGGER.info("MelView unit list changed; reloading without snapshot")
+            await snapshot.async_clear()
+            hass.config_entries.async_schedule_reload(entry.entry_id)
+            return
+
+    # Restored units are ready and refresh once; units that never answered
+    # retry until they do, just as on a fresh start.
+    await _async_first_refresh(entry, profiler)
+
+
 async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(
         config_entry, PLATFORMS
     )
+    if unload_ok:
+        for coordinator in config_entry.runtime_data:
+            await coordinator.device.async_close()
+        clear_traces(config_entry.entry_id)
+        hass.data[DOMAIN]["startup"].pop(config_entry.entry_id, None)
 
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove persisted state when the entry is deleted."""
+    await MelViewSnapshotStore(hass, entry.entry_id).async_clear()
+    await MelViewCommandQueue(hass, entry.entry_id).async_clear()
+
+
 async def async_migrate_entry(hass, config_entry):
     """Migrate old config entry."""
     data = {**config_entry.data}
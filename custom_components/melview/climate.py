@@ -3,6 +3,7 @@ import logging
 from homeassistant.components import logbook
 from homeassistant.components.climate import ClimateEntity
 from homeassistant.components.climate.const import (
+    ATTR_HVAC_MODE,
     ClimateEntityFeature,
     HVACAction,
     HVACMode,
@@ -14,10 +15,12 @@ from homeassistant.const import (
     STATE_OFF,
     UnitOfTemperature,
 )
+from homeassistant.core import callback
 
 from .coordinator import MelViewCoordinator
 from .entity import MelViewBaseEntity
 from .melview import MODE
+from .tracing import traced
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -53,8 +56,6 @@ class MelViewClimate(MelViewBaseEntity, ClimateEntity):
             self._precision = PRECISION_HALVES
             self._target_step = 0.5
 
-        await self._device.async_force_update()
-
     @property
     def supported_features(self):
         """Let HASS know feature support"""
@@ -70,8 +71,8 @@ class MelViewClimate(MelViewBaseEntity, ClimateEntity):
     @property
     def state(self):
         """Return the current state"""
-        power = self.coordinator.data.get("power", 0)
-        if power == 0:
+        data = self.coordinator.data or {}
+        if data.get("power", 0) == 0:
             return STATE_OFF
         return self.hvac_mode
 
@@ -91,8 +92,10 @@ class MelViewClimate(MelViewBaseEntity, ClimateEntity):
         return UnitOfTemperature.CELSIUS
 
     @property
-    def current_temperature(self) -> float:
+    def current_temperature(self) -> float | None:
         """Get the current room temperature"""
+        if self.coordinator.data is None:
+            return None
         val = self.coordinator.data.get("roomtemp", 0)
         try:
             return float(val)
@@ -103,7 +106,9 @@ class MelViewClimate(MelViewBaseEntity, ClimateEntity):
     @property
     def target_temperature(self) -> float | None:
         """Get the target temperature"""
-        val = self.coordinator.data.get("settemp")
+        val = (self.coordinator.data or {}).get("settemp")
+        if val is None:
+            return None
         try:
             return float(val)
         except (TypeError, ValueError):
@@ -134,9 +139,10 @@ class MelViewClimate(MelViewBaseEntity, ClimateEntity):
     @property
     def hvac_mode(self):
         """Get the current operating mode"""
-        if self.coordinator.data.get("power", 0) == 0:
+        data = self.coordinator.data or {}
+        if data.get("power", 0) == 0:
             return HVACMode.OFF
-        mode_index = self.coordinator.data.get("setmode")
+        mode_index = data.get("setmode")
         mode = next(
             (mode for mode, val in MODE.items() if val == mode_index), HVACMode.AUTO
         )
@@ -150,7 +156,9 @@ class MelViewClimate(MelViewBaseEntity, ClimateEntity):
     @property
     def fan_mode(self) -> str | None:
         """Return the current fan speed label."""
-        code = self.coordinator.data.get("setfan")
+        code = (self.coordinator.data or {}).get("setfan")
+        if code is None:
+            return None
         label = self._device.fan.get(code)
         if label is None:
             _LOGGER.error("Fan code %s not present in available modes", code)
@@ -174,14 +182,20 @@ class MelViewClimate(MelViewBaseEntity, ClimateEntity):
             return HVACAction.FAN
         return None
 
+    @traced("climate.set_temperature")
     async def async_set_temperature(self, **kwargs) -> None:
         """Set the target temperature"""
         temp = kwargs.get(ATTR_TEMPERATURE)
-        if temp is not None:
-            _LOGGER.debug("Set temperature %d", temp)
-            if await self._device.async_set_temperature(temp):
+        hvac_mode = kwargs.get(ATTR_HVAC_MODE)
+        if hvac_mode == HVACMode.OFF:
+            await self.async_turn_off()
+            hvac_mode = None
+        if temp is not None or hvac_mode is not None:
+            _LOGGER.debug("Set temperature %s (mode %s)", temp, hvac_mode)
+            if await self._device.async_apply(mode=hvac_mode, temperature=temp):
                 await self.coordinator.async_refresh()
 
+    @traced("climate.set_fan_mode")
     async def async_set_fan_mode(self, fan_mode) -> None:
         """Set the fan speed"""
         speed = fan_mode
@@ -196,6 +210,7 @@ class MelViewClimate(MelViewBaseEntity, ClimateEntity):
                 entity_id=self.entity_id,
             )
 
+    @traced("climate.set_hvac_mode")
     async def async_set_hvac_mode(self, hvac_mode) -> None:
         _LOGGER.debug("Set mode: %s", hvac_mode)
         if hvac_mode == HVACMode.OFF:
@@ -203,12 +218,14 @@ class MelViewClimate(MelViewBaseEntity, ClimateEntity):
         elif await self._device.async_set_mode(hvac_mode):
             await self.coordinator.async_refresh()
 
+    @traced("climate.turn_on")
     async def async_turn_on(self) -> None:
         """Turn on the unit"""
         _LOGGER.debug("Power on")
         if await self._device.async_power_on():
             await self.coordinator.async_refresh()
 
+    @traced("climate.turn_off")
     async def async_turn_off(self) -> None:
         """Turn off the unit"""
         _LOGGER.debug("Power off")
@@ -218,10 +235,11 @@ class MelViewClimate(MelViewBaseEntity, ClimateEntity):
 
 async def async_setup_entry(hass, entry, async_add_entities) -> None:
     """Set up MelView device climate based on config_entry."""
-    coordinators = entry.runtime_data
-    entities = [
-        MelViewClimate(coordinator)
-        for coordinator in coordinators
-        if coordinator.device.get_unit_type() != "ERV"
-    ]
-    async_add_entities(entities, update_before_add=True)
+
+    @callback
+    def _async_add_unit(coordinator: MelViewCoordinator) -> None:
+        if coordinator.device.get_unit_type() != "ERV":
+            async_add_entities([MelViewClimate(coordinator)])
+
+    for coordinator in entry.runtime_data:
+        coordinator.async_when_ready(_async_add_unit)
@@ -0,0 +1,141 @@
+"""Durable queue of MelView commands that failed to send."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+from .melview import MelViewDevice
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 5
+COMMAND_TTL = 600  # Queued commands older than this are dropped.
+REPLAY_SPACING = 1.0  # Minimum gap between replayed requests.
+
+
+def _kind(command: str) -> str:
+    """Return the supersession key of a single command, e.g. 'MD' or 'Z3'."""
+    if command.startswith("Z"):
+        return command[:-1]
+    return command[:2]
+
+
+class MelViewCommandQueue:
+    """Keep the latest failed intent per command kind for each unit."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._store: Store = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.commands"
+        )
+        self._units: dict[str, dict[str, dict]] = {}
+        self._replay_lock = asyncio.Lock()
+
+    async def async_load(self) -> None:
+        """Load commands queued before a restart."""
+        data = await self._store.async_load()
+        self._units = (data or {}).get("units", {})
+
+    @callback
+    def async_add(self, unit_id, command: str, queued_at: float | None = None):
+        """Queue a (possibly combined) command, superseding older ones."""
+        pending = self._units.setdefault(str(unit_id), {})
+        queued_at = queued_at or time.time()
+        for part in command.split(","):
+            kind = _kind(part)
+            current = pending.get(kind)
+            if current is not None and current["queued_at"] > queued_at:
+                continue
+            pending[kind] = {"command": part, "queued_at": queued_at}
+        _LOGGER.info("Queued command %s for unit %s", command, unit_id)
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def async_discard(self, unit_id, command: str) -> None:
+        """Drop queued commands superseded by a command that was sent."""
+        unit = str(unit_id)
+        pending = self._units.get(unit)
+        if not pending:
+            return
+        kinds = {_kind(part) for part in command.split(",")} & pending.keys()
+        if not kinds:
+            return
+        for kind in kinds:
+            _LOGGER.debug(
+                "Dropping queued command %s for unit %s, superseded by %s",
+                pending.pop(kind)["command"],
+                unit,
+                command,
+            )
+        if not pending:
+            del self._units[unit]
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def _expire(self, unit: str) -> None:
+        pending = self._units.get(unit)
+        if not pending:
+            return
+        cutoff = time.time() - COMMAND_TTL
+        expired = [kind for kind, item in pending.items() if item["queued_at"] < cutoff]
+        for kind in expired:
+            _LOGGER.warning(
+                "Dropping expired command %s for unit %s",
+                pending.pop(kind)["command"],
+                unit,
+            )
+        if not pending:
+            del self._units[unit]
+
+    def has_pending(self, unit_id) -> bool:
+        """Return True if commands are waiting for this unit."""
+        return bool(self._units.get(str(unit_id)))
+
+    async def async_replay(self, device: MelViewDevice) -> bool | None:
+        """Send a unit's queued commands as one command; None if nothing to do."""
+        unit = str(device.get_id())
+        self._expire(unit)
+        pending = self._units.pop(unit, None)
+        if not pending:
+            return None
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+        # Power first, so a replayed mode or speed applies to a running unit.
+        items = sorted(
+            pending.values(), key=lambda item: _kind(item["command"]) != "PW"
+        )
+        command = ",".join(item["command"] for item in items)
+        _LOGGER.info("Replaying queued command %s for unit %s", command, unit)
+        async with self._replay_lock:
+            try:
+                ok = await device.async_send_command(command, queue_on_failure=False)
+            except Exception as err:
+                _LOGGER.debug("Replay for unit %s failed: %r", unit, err)
+                ok = False
+            await asyncio.sleep(REPLAY_SPACING)
+        if not ok:
+            for item in items:
+                self.async_add(unit, item["command"], item["queued_at"])
+        return ok
+
+    def unit_stats(self, unit_id) -> dict:
+        """Return queue depth and age of the oldest command for a unit."""
+        pending = self._units.get(str(unit_id)) or {}
+        oldest = min((item["queued_at"] for item in pending.values()), default=None)
+        return {
+            "depth": len(pending),
+            "oldest_age": round(time.time() - oldest, 1) if oldest else None,
+        }
+
+    async def async_clear(self) -> None:
+        """Drop all queued commands."""
+        self._units = {}
+        await self._store.async_remove()
+
+    @callback
+    def _data_to_save(self) -> dict:
+        return {"units": self._units}
@@ -12,7 +12,16 @@ from homeassistant import config_entries
 from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
 from homeassistant.core import callback
 
-from .const import CONF_LOCAL, CONF_SENSOR, DOMAIN
+from .const import (
+    CONF_LOCAL,
+    CONF_QUEUE,
+    CONF_ROLLING,
+    CONF_SENSOR,
+    CONF_STALE_THRESHOLD,
+    CONF_TELEMETRY,
+    DEFAULT_STALE_THRESHOLD,
+    DOMAIN,
+)
 from .melview import MelViewAuthentication
 
 _LOGGER = logging.getLogger(__name__)
@@ -247,6 +256,12 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
 
         local = True
         sensor = True
+        rolling = self._config_entry.options.get(CONF_ROLLING, False)
+        queue = self._config_entry.options.get(CONF_QUEUE, False)
+        telemetry = self._config_entry.options.get(CONF_TELEMETRY, False)
+        stale_threshold = self._config_entry.options.get(
+            CONF_STALE_THRESHOLD, DEFAULT_STALE_THRESHOLD
+        )
 
         if CONF_LOCAL in self._config_entry.data:
             local = self._config_entry.data[CONF_LOCAL]
@@ -265,6 +280,12 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 {
                     vol.Required(CONF_LOCAL, default=local): bool,
                     vol.Required(CONF_SENSOR, default=sensor): bool,
+                    vol.Required(CONF_ROLLING, default=rolling): bool,
+                    vol.Required(CONF_QUEUE, default=queue): bool,
+                    vol.Required(CONF_TELEMETRY, default=telemetry): bool,
+                    vol.Required(
+                        CONF_STALE_THRESHOLD, default=stale_threshold
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=1440)),
                 }
             ),
         )
@@ -7,7 +7,14 @@ CONF_EMAIL = "email"
 CONF_PASSWORD = "password"
 CONF_LOCAL = "local"
 CONF_SENSOR = "sensor"
+CONF_ROLLING = "rolling_stats"
+CONF_QUEUE = "queue_commands"
+CONF_TELEMETRY = "telemetry"
+CONF_STALE_THRESHOLD = "stale_threshold"
 
+DEFAULT_STALE_THRESHOLD = 15  # Minutes; 0 disables the stale data watchdog.
+
+API_URL = "https://api.melview.net/api"
 APPVERSION = "6.5.2090"
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/18.4 Safari/605.1.15"
@@ -1,18 +1,46 @@
+import asyncio
 import json
 import logging
-from datetime import timedelta
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta
 
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .melview import MelViewDevice
+from .profiling import profiled
+from .rolling import RollingWindow
+from .tracing import async_span
 
 _LOGGER = logging.getLogger(__name__)
 
+# Window in which concurrent zone changes are combined into one command.
+ZONE_BATCH_DELAY = 0.25
+
+# Backoff between first refresh attempts while capabilities are unknown.
+START_RETRY_MIN = 30
+START_RETRY_MAX = 300
+
+# Rolling statistics: one sample per poll interval, one hour of history.
+ROLLING_KEYS = ("roomtemp", "outdoortemp", "exhausttemp", "coreefficiency")
+ROLLING_INTERVAL = 30
+ROLLING_MAX_AGE = 3600
+ROLLING_SAMPLES = ROLLING_MAX_AGE // ROLLING_INTERVAL
+
 
 class MelViewCoordinator(DataUpdateCoordinator):
     """Coordinator to fetch data from a MelView API once per interval."""
 
-    def __init__(self, hass, config_entry, device: MelViewDevice):
+    def __init__(
+        self,
+        hass,
+        config_entry,
+        device: MelViewDevice,
+        snapshot=None,
+        queue=None,
+        telemetry=None,
+    ):
         """Initialize."""
         super().__init__(
             hass,
@@ -23,16 +51,153 @@ class MelViewCoordinator(DataUpdateCoordinator):
             always_update=True,
         )
         self.device = device
+        self.stale = False
+        self.ready = False
+        self._ready_callbacks: list[Callable[["MelViewCoordinator"], None]] = []
         self._caps: dict | None = None
+        self._snapshot = snapshot
+        self._queue = queue
+        self.telemetry = telemetry
+        self._replay: asyncio.Task | None = None
+        device.set_background_task_handler(
+            lambda coro, name: config_entry.async_create_background_task(
+                hass, coro, name
+            )
+        )
+        if queue is not None:
+            device.set_command_failed_handler(
+                lambda command: queue.async_add(device.get_id(), command)
+            )
+            device.set_command_sent_handler(
+                lambda command: queue.async_discard(device.get_id(), command)
+            )
+        self._pending_zones: dict = {}
+        self._zone_flush: asyncio.Task | None = None
+        self.rolling: dict[str, RollingWindow] = {}
+        self._last_sample: float | None = None
+        self._data_time: float | None = None
+        self._restored_time: float | None = None
+        self._started = time.monotonic()
+        self._poll_end: float | None = None
+        self.poll_lag: float | None = None
+        self._paused_since: float | None = None
+        self._paused_total = 0.0
 
     def __getattr__(self, name: str):
         """Forward any missing attribute lookups to the underlying MelViewDevice."""
         return getattr(self.device, name)
 
+    @callback
+    def async_restore(self, data: dict, updated: str | None = None) -> None:
+        """Serve last known state, marked stale, until the first refresh."""
+        self.stale = True
+        self.data = data
+        if updated is not None:
+            self._restored_time = datetime.fromisoformat(updated).timestamp()
+        self._async_set_ready()
+
+    @callback
+    def async_when_ready(self, ready_callback) -> None:
+        """Call back once capabilities are known and entities can be built."""
+        if self.ready:
+            ready_callback(self)
+        else:
+            self._ready_callbacks.append(ready_callback)
+
+    @callback
+    def _async_set_ready(self) -> None:
+        self.ready = True
+        callbacks, self._ready_callbacks = self._ready_callbacks, []
+        for ready_callback in callbacks:
+            ready_callback(self)
+        if self.paused and self._paused_since is None:
+            # Cleared as entities subscribe; kept if they are all disabled.
+            self._paused_since = time.monotonic()
+
+    @property
+    def paused(self) -> bool:
+        """Return True while polling is paused for lack of enabled entities.
+
+        Disabled entities never subscribe, so once a ready unit has no
+        listeners Home Assistant stops scheduling its polls.
+        """
+        return self.ready and not self._listeners
+
+    @callback
+    def async_add_listener(self, update_callback, context=None) -> Callable[[], None]:
+        """Listen for updates, tracking how long polling stays paused."""
+        if self._paused_since is not None:
+            self._paused_total += time.monotonic() - self._paused_since
+            self._paused_since = None
+        remove = super().async_add_listener(update_callback, context)
+
+        @callback
+        def remove_listener() -> None:
+            remove()
+            if self.paused and self._paused_since is None:
+                self._paused_since = time.monotonic()
+                # No poll is due while paused.
+                self._poll_end = None
+
+        return remove_listener
+
+    @property
+    def skipped_polls(self) -> int:
+        """Return how many polls were skipped while paused."""
+        paused = self._paused_total
+        if self._paused_since is not None:
+            paused += time.monotonic() - self._paused_since
+        return int(paused // self.update_interval.total_seconds())
+
+    async def async_start(
+        self,
+        semaphore: asyncio.Semaphore,
+        on_first_attempt: Callable[[], None] | None = None,
+    ) -> None:
+        """Refresh until capabilities are known, then announce readiness.
+
+        A unit whose state refresh fails after caps are known is still
+        announced; its entities show as unavailable until a poll succeeds.
+        ``on_first_attempt`` is called once the first refresh has finished,
+        whether or not it succeeded.
+        """
+        delay = START_RETRY_MIN
+        while True:
+            async with semaphore:
+                await self.async_refresh()
+            if on_first_attempt is not None:
+                on_first_attempt()
+                on_first_attempt = None
+            if self.device._caps is not None:
+                break
+            _LOGGER.warning(
+                "%s did not respond, retrying in %ds", self.name, delay
+            )
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, START_RETRY_MAX)
+        self._async_set_ready()
+
+    @profiled("coordinator.update")
     async def _async_update_data(self):
-        """Fetch data from the MelView API."""
+        """Fetch data from the MelView API, noting how late the poll started."""
+        now = time.monotonic()
+        if self.ready and self._poll_end is not None:
+            # The next poll is due update_interval after the previous one ends;
+            # refreshes requested sooner, e.g. after a command, count as on time.
+            due = self._poll_end + self.update_interval.total_seconds()
+            self.poll_lag = max(0.0, now - due)
+        try:
+            async with async_span(
+                "poll", self.config_entry.entry_id, unit=self.device.get_id()
+            ):
+                return await self._async_poll()
+        finally:
+            self._poll_end = time.monotonic()
+
+    async def _async_poll(self):
+        """Refresh caps if needed, then unit state."""
         try:
-            if self._caps is None:
+            if not self._caps or self.device.is_caps_outdated():
                 self._caps = await self.device.async_refresh_device_caps()
                 _LOGGER.debug(
                     "Unit capabilities: %s", json.dumps(self.device._caps, indent=2)
@@ -41,6 +206,92 @@ class MelViewCoordinator(DataUpdateCoordinator):
             if not ok or self.device._json is None:
                 raise UpdateFailed("Failed to refresh MelView info")
             _LOGGER.debug("Data: %s", json.dumps(self.device._json, indent=2))
-            return self.device._json
         except Exception as err:
-            raise UpdateFailed(str(err)) from err
\ No newline at end of file
+            if self.stale:
+                _LOGGER.debug("Keeping last known state for %s: %s", self.name, err)
+                return self.data
+            raise UpdateFailed(str(err)) from err
+        self.stale = False
+        self._data_time = time.monotonic()
+        if self._snapshot is not None:
+            self._snapshot.async_update(self.device)
+        if self.telemetry is not None:
+            self.telemetry.async_record(self.device.get_id(), self.device._json)
+        self._record_samples(self.device._json)
+        if (
+            self._queue is not None
+            and self._replay is None
+            and self._queue.has_pending(self.device.get_id())
+        ):
+            self._replay = self.config_entry.async_create_background_task(
+                self.hass, self._async_replay(), f"{self.name} command replay"
+            )
+        return self.device._json
+
+    async def _async_replay(self) -> None:
+        """Replay queued commands now the unit is reachable again."""
+        try:
+            if await self._queue.async_replay(self.device):
+                await self.async_request_refresh()
+        finally:
+            self._replay = None
+
+    def data_age(self) -> float | None:
+        """Return seconds since the data was fetched, if it ever was."""
+        if self._data_time is None:
+            if self._restored_time is None:
+                return None
+            # Restored from the snapshot; its timestamp is wall-clock time.
+            return max(0.0, time.time() - self._restored_time)
+        return time.monotonic() - self._data_time
+
+    def watchdog_age(self) -> float:
+        """Return seconds since the last successful poll, or since start."""
+        since = self._started if self._data_time is None else self._data_time
+        return time.monotonic() - since
+
+    def get_queue_stats(self) -> dict | None:
+        """Return depth and age of this unit's queued commands."""
+        if self._queue is None:
+            return None
+        return self._queue.unit_stats(self.device.get_id())
+
+    def _record_samples(self, data: dict) -> None:
+        """Add readings to the rolling windows, at most once per interval."""
+        now = time.monotonic()
+        if self._last_sample is not None and now - self._last_sample < (
+            ROLLING_INTERVAL * 0.9
+        ):
+            return
+        self._last_sample = now
+        for key in ROLLING_KEYS:
+            if key not in data:
+                continue
+            try:
+                value = float(data[key])
+            except (TypeError, ValueError):
+                continue
+            window = self.rolling.get(key)
+            if window is None:
+                window = self.rolling[key] = RollingWindow(
+                    ROLLING_SAMPLES, ROLLING_MAX_AGE
+                )
+            window.push(value, now)
+
+    async def async_set_zone(self, zoneid, on: bool) -> bool:
+        """Set a zone, batching concurrent zone changes into one command."""
+        self._pending_zones[zoneid] = on
+        if self._zone_flush is None:
+            self._zone_flush = self.hass.async_create_task(self._async_flush_zones())
+        return await asyncio.shield(self._zone_flush)
+
+    async def _async_flush_zones(self) -> bool:
+        """Send all pending zone changes followed by a single refresh."""
+        await asyncio.sleep(ZONE_BATCH_DELAY)
+        zones, self._pending_zones = self._pending_zones, {}
+        self._zone_flush = None
+        _LOGGER.debug("Setting zones: %s", zones)
+        if not await self.device.async_set_zones(zones):
+            return False
+        await self.async_refresh()
+        return True
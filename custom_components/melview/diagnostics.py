@@ -0,0 +1,49 @@
+"""Diagnostics support for MelView."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
+from homeassistant.core import HomeAssistant
+
+from . import MelViewConfigEntry
+from .const import DOMAIN
+from .tracing import get_traces
+
+TO_REDACT = {CONF_EMAIL, CONF_PASSWORD, "title", "unique_id", "localip", "host"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: MelViewConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    profiler = hass.data.get(DOMAIN, {}).get("startup", {}).get(entry.entry_id)
+    coordinators = getattr(entry, "runtime_data", None) or []
+    telemetry = next((c.telemetry for c in coordinators if c.telemetry), None)
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "startup": profiler.as_dict() if profiler is not None else None,
+        "traces": get_traces(entry.entry_id),
+        "telemetry": telemetry.stats() if telemetry is not None else None,
+        "units": [
+            {
+                "id": coordinator.get_id(),
+                "unit_type": coordinator.get_unit_type(),
+                "ready": coordinator.ready,
+                "last_update_success": coordinator.last_update_success,
+                "stale": coordinator.stale,
+                "paused": coordinator.paused,
+                "skipped_polls": coordinator.skipped_polls,
+                "data_age": coordinator.data_age(),
+                "poll_lag": coordinator.poll_lag,
+                "caps": async_redact_data(coordinator.device._caps or {}, TO_REDACT),
+                "command_queue": coordinator.get_queue_stats(),
+                "local_adapter": async_redact_data(
+                    coordinator.get_local_adapter_stats() or {}, TO_REDACT
+                ),
+            }
+            for coordinator in coordinators
+        ],
+    }
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+from homeassistant.core import callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, MANUFACTURER
 from .coordinator import MelViewCoordinator
+from .profiling import profiled
 
 
 class MelViewBaseEntity(CoordinatorEntity[MelViewCoordinator]):
@@ -21,3 +23,16 @@ class MelViewBaseEntity(CoordinatorEntity[MelViewCoordinator]):
             manufacturer=MANUFACTURER,
             model=getattr(device, "model", None),
         )
+
+    @callback
+    @profiled("entity.state_write")
+    def _handle_coordinator_update(self) -> None:
+        super()._handle_coordinator_update()
+
+    @property
+    def extra_state_attributes(self):
+        """Flag values served from the persisted snapshot as stale."""
+        attrs = super().extra_state_attributes
+        if self.coordinator.stale:
+            return {**(attrs or {}), "stale": True}
+        return attrs
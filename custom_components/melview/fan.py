@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 
 from homeassistant.components.fan import FanEntity, FanEntityFeature
+from homeassistant.core import callback
 from homeassistant.util.percentage import (
     ordered_list_item_to_percentage,
     percentage_to_ordered_list_item,
@@ -11,6 +12,7 @@ from homeassistant.util.percentage import (
 from .coordinator import MelViewCoordinator
 from .entity import MelViewBaseEntity
 from .melview import LOSSNAY_PRESETS
+from .tracing import traced
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -38,26 +40,25 @@ class MelViewLossnayFan(MelViewBaseEntity, FanEntity):
 
     @property
     def is_on(self) -> bool:
-        return self.coordinator.data.get("power") == 1
+        return (self.coordinator.data or {}).get("power") == 1
 
     @property
     def preset_mode(self) -> str | None:
-        code = self.coordinator.data.get("setmode")
+        code = (self.coordinator.data or {}).get("setmode")
         return next(
             (name for name, val in LOSSNAY_PRESETS.items() if val == code), None
         )
 
+    @traced("fan.set_preset_mode")
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         if preset_mode not in LOSSNAY_PRESETS:
             _LOGGER.error("Preset mode %s not supported", preset_mode)
             return
-        if not self.is_on:
-            if not await self.coordinator.async_power_on():
-                return
         if await self.coordinator.async_set_lossnay_preset(preset_mode):
             self._last_preset = preset_mode
             await self.coordinator.async_request_refresh()
 
+    @traced("fan.turn_on")
     async def async_turn_on(
         self,
         preset_mode: str | None = None,
@@ -72,13 +73,14 @@ class MelViewLossnayFan(MelViewBaseEntity, FanEntity):
             if await self.coordinator.async_power_on():
                 await self.coordinator.async_request_refresh()
 
+    @traced("fan.turn_off")
     async def async_turn_off(self, **kwargs) -> None:
         if await self.coordinator.async_power_off():
             await self.coordinator.async_request_refresh()
 
     @property
     def percentage(self) -> int | None:
-        code = self.coordinator.data.get("setfan")
+        code = (self.coordinator.data or {}).get("setfan")
         if code in self._speed_codes:
             percentage = ordered_list_item_to_percentage(self._speed_codes, code)
             _LOGGER.debug(
@@ -100,6 +102,7 @@ class MelViewLossnayFan(MelViewBaseEntity, FanEntity):
         )
         return count
 
+    @traced("fan.set_percentage")
     async def async_set_percentage(self, percentage: int) -> None:
         code = percentage_to_ordered_list_item(self._speed_codes, percentage)
         _LOGGER.debug(
@@ -111,11 +114,11 @@ class MelViewLossnayFan(MelViewBaseEntity, FanEntity):
 
 async def async_setup_entry(hass, entry, async_add_entities) -> None:
     """Set up MelView Lossnay fans based on a config entry."""
-    coordinators = entry.runtime_data
-    entities = [
-        MelViewLossnayFan(coordinator)
-        for coordinator in coordinators
-        if coordinator.device.get_unit_type() == "ERV"
-    ]
-    if entities:
-        async_add_entities(entities, update_before_add=True)
+
+    @callback
+    def _async_add_unit(coordinator: MelViewCoordinator) -> None:
+        if coordinator.device.get_unit_type() == "ERV":
+            async_add_entities([MelViewLossnayFan(coordinator)])
+
+    for coordinator in entry.runtime_data:
+        coordinator.async_when_ready(_async_add_unit)
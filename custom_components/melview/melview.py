@@ -1,11 +1,15 @@
+import asyncio
 import json
 import logging
 import time
+from contextlib import nullcontext
 
-from aiohttp import ClientSession
+from aiohttp import ClientError, ClientSession, ClientTimeout
 from homeassistant.components.climate.const import HVACMode
 
-from .const import APIVERSION, APPVERSION, HEADERS
+from .const import API_URL, APIVERSION, APPVERSION, HEADERS
+from .profiling import profiled
+from .tracing import async_span
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -13,6 +17,10 @@ _LOGGER = logging.getLogger(__name__)
 LOCAL_DATA = """<?xml version="1.0" encoding="UTF-8"?>
 <ESV>{}</ESV>"""
 
+LOCAL_TIMEOUT = ClientTimeout(total=3)
+LOCAL_MAX_FAILURES = 3  # Consecutive failures before suspending local relay.
+LOCAL_PROBE_SECONDS = 300  # Suspended adapters are probed this often.
+
 MODE = {
     HVACMode.AUTO: 8,
     HVACMode.HEAT: 1,
@@ -39,24 +47,33 @@ LOSSNAY_PRESETS = {
 class MelViewAuthentication:
     """Implementation to remember and refresh MelView cookies."""
 
-    def __init__(self, email, password):
+    def __init__(self, email, password, api_url=API_URL):
         self._email = email
         self._password = password
+        self._api_url = api_url.rstrip("/")
         self._cookie = None
         self._login_json = None
+        self.request_count = 0
+        self.bytes_received = 0
+
+    def record_response(self, size):
+        """Count a completed API request and the size of its body"""
+        self.request_count += 1
+        self.bytes_received += size
 
     def is_login(self):
         """Return login status"""
         return self._cookie is not None
 
+    @profiled("api.login")
     async def async_login(self):
         """Generate a new login cookie"""
         _LOGGER.debug("Trying to login")
         self._cookie = None
         self._login_json = None
-        async with ClientSession() as session:
+        async with async_span("login"), ClientSession() as session:
             req = await session.post(
-                "https://api.melview.net/api/login.aspx",
+                self.get_url("login.aspx"),
                 json={
                     "user": self._email,
                     "pass": self._password,
@@ -64,6 +81,8 @@ class MelViewAuthentication:
                 },
                 headers=HEADERS,
             )
+        # Chunked replies have no Content-Length; count the body read.
+        self.record_response(len(await req.read()))
         self._login_json = await req.json()
         _LOGGER.debug("Login status code: %d", req.status)
         _LOGGER.debug(
@@ -110,6 +129,10 @@ class MelViewAuthentication:
             )
         return False
 
+    def get_url(self, endpoint):
+        """Return the full URL for an API endpoint"""
+        return f"{self._api_url}/{endpoint}"
+
     def get_cookie(self):
         """Return authentication cookie"""
         return {"auth": self._cookie}
@@ -124,11 +147,122 @@ class MelViewAuthentication:
             return False
 
 
+class MelViewLocalAdapter:
+    """Relay local commands to a Wi-Fi adapter and track its health"""
+
+    def __init__(self, host):
+        self.host = host
+        self._session = None
+        self._reset()
+
+    def _reset(self):
+        self.successes = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.latency_ms = None
+        self.last_error = None
+        self.suspended = False
+
+    def set_host(self, host):
+        """Follow an adapter that has changed IP, clearing its history"""
+        if host != self.host:
+            _LOGGER.info("Adapter address changed from %s to %s", self.host, host)
+            self.host = host
+            self._reset()
+
+    def is_suspended(self):
+        """Return True while the local relay is suspended after failures"""
+        return self.suspended
+
+    def _get_session(self):
+        if self._session is None or self._session.closed:
+            self._session = ClientSession(timeout=LOCAL_TIMEOUT)
+        return self._session
+
+    @profiled("api.local_relay")
+    async def async_send(self, local_command):
+        """Send a local command key, returning True on success"""
+        session = self._get_session()
+        start = time.monotonic()
+        try:
+            async with session.post(
+                "http://{}/smart".format(self.host),
+                data=LOCAL_DATA.format(local_command),
+            ) as resp:
+                error = None if resp.status == 200 else f"status {resp.status}"
+        except (ClientError, asyncio.TimeoutError) as err:
+            error = repr(err)
+        elapsed_ms = (time.monotonic() - start) * 1000
+
+        if error is None:
+            self.successes += 1
+            self.consecutive_failures = 0
+            if self.latency_ms is None:
+                self.latency_ms = elapsed_ms
+            else:
+                self.latency_ms += 0.2 * (elapsed_ms - self.latency_ms)
+            return True
+
+        self.failures += 1
+        self.consecutive_failures += 1
+        self.last_error = error
+        if self.consecutive_failures >= LOCAL_MAX_FAILURES:
+            self.suspended = True
+        return False
+
+    async def async_probe(self):
+        """Check whether a suspended adapter answers again and resume it.
+
+        Any HTTP response counts; no command is sent to the unit.
+        """
+        try:
+            async with self._get_session().get(f"http://{self.host}/"):
+                pass
+        except (ClientError, asyncio.TimeoutError) as err:
+            self.last_error = repr(err)
+            return False
+        self.consecutive_failures = 0
+        self.suspended = False
+        return True
+
+    async def async_close(self):
+        """Close the adapter's HTTP session"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def as_dict(self):
+        """Return health statistics"""
+        return {
+            "host": self.host,
+            "successes": self.successes,
+            "failures": self.failures,
+            "consecutive_failures": self.consecutive_failures,
+            "latency_ms": (
+                round(self.latency_ms, 1) if self.latency_ms is not None else None
+            ),
+            "last_error": self.last_error,
+            "suspended": self.is_suspended(),
+        }
+
+
 class MelViewZone:
+    """State of a single zone, updated in place on every refresh"""
+
+    __slots__ = ("id", "name", "status", "changed")
+
     def __init__(self, id, name, status):
         self.id = id
         self.name = name
         self.status = status
+        self.changed = True
+
+    def update(self, name, status):
+        """Update zone state, flagging whether anything changed"""
+        self.changed = name != self.name or status != self.status
+        self.name = name
+        self.status = status
+        return self.changed
 
 
 class MelViewDevice:
@@ -145,15 +279,33 @@ class MelViewDevice:
         self._caps = None
         self._info_lease_seconds = 30  # Data lasts for 30s.
         self._json = None
+        self._last_info_time_s = 0
         self._localip = localcontrol
+        self._local_adapter = None
+        self._caps_outdated = False
+        self._command_failed = None
+        self._command_sent = None
+        self._create_task = None
+        self._background = set()
+        self._probing = False
+        self.request_count = 0
+        self.bytes_received = 0
         self._standby = 0
         self._zones = {}
 
         self.fan = FANSTAGES[3]
+        self.fan_keyed = {value: key for key, value in self.fan.items()}
         self.halfdeg = False
         self.model = None
         self.temp_ranges = {}
 
+    async def _async_record_response(self, resp):
+        """Read a response and count it against this unit and the account"""
+        size = len(await resp.read())
+        self.request_count += 1
+        self.bytes_received += size
+        self._authentication.record_response(size)
+
     async def async_refresh(self):
         await self.async_refresh_device_caps()
         await self.async_refresh_device_info()
@@ -161,39 +313,71 @@ class MelViewDevice:
     def __str__(self):
         return str(self._json)
 
+    def _apply_caps(self, caps):
+        """Derive fan stages, temperature ranges and model from capabilities"""
+        self._caps = caps
+        if self._localip and "localip" in self._caps:
+            self._localip = self._caps["localip"]
+            if self._local_adapter is None:
+                self._local_adapter = MelViewLocalAdapter(self._localip)
+            else:
+                self._local_adapter.set_host(self._localip)
+        self._caps_outdated = False
+        if self._caps["fanstage"]:
+            self.fan = dict(FANSTAGES[self._caps["fanstage"]])
+        if "hasautofan" in self._caps and self._caps["hasautofan"] == 1:
+            self.fan[0] = "auto"
+        self.fan_keyed = {value: key for key, value in self.fan.items()}
+        if "max" in self._caps:
+            for hvac_mode, mode_id in MODE.items():
+                caps_range = self._caps["max"].get(str(mode_id))
+                if caps_range and "min" in caps_range and "max" in caps_range:
+                    self.temp_ranges[hvac_mode] = {
+                        "min": caps_range["min"],
+                        "max": caps_range["max"],
+                    }
+                    if hvac_mode == HVACMode.COOL:
+                        self.temp_ranges[HVACMode.DRY] = dict(
+                            self.temp_ranges[HVACMode.COOL]
+                        )
+        if "modelname" in self._caps:
+            self.model = self._caps["modelname"]
+        if "halfdeg" in self._caps and self._caps["halfdeg"] == 1:
+            self.halfdeg = True
+
+    def snapshot(self):
+        """Return the cached capabilities and state for persisting"""
+        return {
+            "unitid": self._deviceid,
+            "buildingid": self._buildingid,
+            "name": self._friendlyname,
+            "caps": self._caps,
+            "state": self._json,
+        }
+
+    def restore(self, caps, state):
+        """Restore capabilities and last known state from a snapshot"""
+        self._apply_caps(caps)
+        self._json = state
+        if "zones" in state:
+            self._update_zones(state["zones"])
+        if "standby" in state:
+            self._standby = state["standby"]
+
+    @profiled("api.caps")
     async def async_refresh_device_caps(self, retry=True):
 
-        async with ClientSession() as session:
+        async with async_span(
+            "caps", unit=self._deviceid
+        ), ClientSession() as session:
             async with session.post(
-                "https://api.melview.net/api/unitcapabilities.aspx",
+                self._authentication.get_url("unitcapabilities.aspx"),
                 cookies=self._authentication.get_cookie(),
                 json={"unitid": self._deviceid, "v": APIVERSION},
             ) as resp:
+                await self._async_record_response(resp)
                 if resp.status == 200:
-                    self._caps = await resp.json()
-                    if self._localip and "localip" in self._caps:
-                        self._localip = self._caps["localip"]
-                    if self._caps["fanstage"]:
-                        self.fan = dict(FANSTAGES[self._caps["fanstage"]])
-                    if "hasautofan" in self._caps and self._caps["hasautofan"] == 1:
-                        self.fan[0] = "auto"
-                    self.fan_keyed = {value: key for key, value in self.fan.items()}
-                    if "max" in self._caps:
-                        for hvac_mode, mode_id in MODE.items():
-                            caps_range = self._caps["max"].get(str(mode_id))
-                            if caps_range and "min" in caps_range and "max" in caps_range:
-                                self.temp_ranges[hvac_mode] = {
-                                    "min": caps_range["min"],
-                                    "max": caps_range["max"],
-                                }
-                                if hvac_mode == HVACMode.COOL:
-                                    self.temp_ranges[HVACMode.DRY] = dict(
-                                        self.temp_ranges[HVACMode.COOL]
-                                    )
-                    if "modelname" in self._caps:
-                        self.model = self._caps["modelname"]
-                    if "halfdeg" in self._caps and self._caps["halfdeg"] == 1:
-                        self.halfdeg = True
+                    self._apply_caps(await resp.json())
                     if "error" in self._caps:
                         if self._caps["error"] != "ok":
                             _LOGGER.warning(
@@ -222,16 +406,20 @@ class MelViewDevice:
             )
         return False
 
+    @profiled("api.info")
     async def async_refresh_device_info(self, retry=True):
         self._json = None
-        self._last_info_time_s = time.time()
+        self._last_info_time_s = time.monotonic()
 
-        async with ClientSession() as session:
+        async with async_span(
+            "info", unit=self._deviceid
+        ), ClientSession() as session:
             async with session.post(
-                "https://api.melview.net/api/unitcommand.aspx",
+                self._authentication.get_url("unitcommand.aspx"),
                 cookies=self._authentication.get_cookie(),
                 json={"unitid": self._deviceid, "v": APIVERSION},
             ) as resp:
+                await self._async_record_response(resp)
                 if resp.status == 200:
                     self._json = await resp.json()
 
@@ -260,10 +448,7 @@ class MelViewDevice:
                         )
 
                     if "zones" in self._json:
-                        self._zones = {
-                            z["zoneid"]: MelViewZone(z["zoneid"], z["name"], z["status"])
-                            for z in self._json["zones"]
-                        }
+                        self._update_zones(self._json["zones"])
                     if "standby" in self._json:
                         self._standby = self._json["standby"]
                     return True
@@ -279,13 +464,29 @@ class MelViewDevice:
             )
         return False
 
+    def _update_zones(self, zones):
+        """Update zone objects in place from the zones payload"""
+        seen = set()
+        for z in zones:
+            zoneid = z["zoneid"]
+            seen.add(zoneid)
+            zone = self._zones.get(zoneid)
+            if zone is None:
+                self._zones[zoneid] = MelViewZone(zoneid, z["name"], z["status"])
+            else:
+                zone.update(z["name"], z["status"])
+        for zoneid in self._zones.keys() - seen:
+            del self._zones[zoneid]
+
     async def async_is_info_valid(self):
         """Ensure cached unit info is fresh."""
         try:
             if self._json is None:
                 return await self.async_refresh_device_info()
 
-            if (time.time() - self._last_info_time_s) >= self._info_lease_seconds:
+            if (
+                time.monotonic() - self._last_info_time_s
+            ) >= self._info_lease_seconds:
                 _LOGGER.debug("Current settings out of date, refreshing")
                 return await self.async_refresh_device_info()
 
@@ -301,16 +502,57 @@ class MelViewDevice:
 
         return True
 
-    async def async_send_command(self, command, retry=True):
+    def set_command_failed_handler(self, handler):
+        """Register a callback receiving commands that could not be sent"""
+        self._command_failed = handler
+
+    def set_command_sent_handler(self, handler):
+        """Register a callback receiving commands that were sent successfully"""
+        self._command_sent = handler
+
+    def set_background_task_handler(self, handler):
+        """Register a callback creating background tasks from (coro, name)"""
+        self._create_task = handler
+
+    def _async_create_task(self, coro, name):
+        """Run a coroutine without waiting for it"""
+        if self._create_task is not None:
+            self._create_task(coro, name)
+            return
+        task = asyncio.get_running_loop().create_task(coro, name=name)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def async_send_command(self, command, queue_on_failure=True):
+        """Send a command, passing it to the failure handler if it fails"""
+        handler = self._command_failed if queue_on_failure else None
+        try:
+            ok = await self._async_post_command(command)
+        except (ClientError, asyncio.TimeoutError) as err:
+            if handler is None:
+                raise
+            _LOGGER.error("Unable to send command %s: %r", command, err)
+            ok = False
+        if not ok and handler is not None:
+            handler(command)
+        elif ok and queue_on_failure and self._command_sent is not None:
+            self._command_sent(command)
+        return ok
+
+    @profiled("api.command")
+    async def _async_post_command(self, command, retry=True):
         _LOGGER.debug("Command issued: %s", command)
 
-        if not await self.async_is_info_valid():
+        # The coordinator keeps the snapshot fresh; only fetch if there is none.
+        if self._json is None and not await self.async_is_info_valid():
             _LOGGER.error("Data outdated, command %s failed", command)
             return False
 
-        async with ClientSession() as session:
+        async with async_span(
+            "cloud_command", unit=self._deviceid, command=command
+        ), ClientSession() as session:
             async with session.post(
-                "https://api.melview.net/api/unitcommand.aspx",
+                self._authentication.get_url("unitcommand.aspx"),
                 cookies=self._authentication.get_cookie(),
                 json={
                     "unitid": self._deviceid,
@@ -319,24 +561,20 @@ class MelViewDevice:
                     "lc": 1,
                 },
             ) as resp:
+                await self._async_record_response(resp)
                 if resp.status == 200:
                     _LOGGER.debug("Command sent to server")
                     data = await resp.json()
                 else:
                     req = resp
         if 'data' in locals():
-            if self._localip:
+            if self._local_adapter is not None:
                 if "lc" in data:
-                    local_command = data["lc"]
-                    async with ClientSession() as session:
-                        req = await session.post(
-                            "http://{}/smart".format(self._localip),
-                            data=LOCAL_DATA.format(local_command),
-                        )
-                    if req.status == 200:
-                        _LOGGER.debug("Command sent locally")
-                    else:
-                        _LOGGER.error("Local command failed")
+                    # The cloud has accepted the command; don't wait on the LAN.
+                    self._async_create_task(
+                        self._async_send_local(data["lc"]),
+                        f"melview {self._deviceid} local relay",
+                    )
                 else:
                     _LOGGER.error("Missing local command key")
 
@@ -344,12 +582,70 @@ class MelViewDevice:
         if req.status == 401 and retry:
             _LOGGER.error("Command send error 401 (trying to relogin)")
             if await self._authentication.async_login():
-                return await self.async_send_command(command, retry=False)
+                return await self._async_post_command(command, retry=False)
         else:
             _LOGGER.error("Unable to send command (invalid status code: %d)", req.status)
 
         return False
 
+    async def _async_send_local(self, local_command):
+        """Relay a local command key unless the adapter is suspended"""
+        adapter = self._local_adapter
+        if adapter.is_suspended():
+            _LOGGER.debug("Local relay to %s suspended, cloud only", adapter.host)
+            return
+        async with async_span("local_relay", unit=self._deviceid) as span:
+            sent = await adapter.async_send(local_command)
+            span.attributes["sent"] = sent
+        if sent:
+            _LOGGER.debug("Command sent locally")
+            return
+        _LOGGER.warning("Local command failed: %s", adapter.last_error)
+        if adapter.is_suspended() and not self._probing:
+            _LOGGER.warning(
+                "%s adapter unreachable after %d failures, "
+                "sending commands via cloud only until it answers again",
+                self.get_friendly_name(),
+                adapter.consecutive_failures,
+            )
+            # The adapter may have a new address; re-read it from caps.
+            self._caps_outdated = True
+            self._probing = True
+            self._async_create_task(
+                self._async_probe_local(), f"melview {self._deviceid} local probe"
+            )
+
+    async def _async_probe_local(self):
+        """Probe a suspended adapter periodically until it answers"""
+        adapter = self._local_adapter
+        try:
+            while adapter.is_suspended():
+                await asyncio.sleep(LOCAL_PROBE_SECONDS)
+                if await adapter.async_probe():
+                    _LOGGER.info(
+                        "%s adapter answering again, resuming local commands",
+                        self.get_friendly_name(),
+                    )
+        finally:
+            self._probing = False
+
+    def is_caps_outdated(self):
+        """Return True if capabilities should be fetched again"""
+        return self._caps_outdated
+
+    def get_local_adapter_stats(self):
+        """Return local adapter health, if local control is enabled"""
+        if self._local_adapter is None:
+            return None
+        return self._local_adapter.as_dict()
+
+    async def async_close(self):
+        """Release network resources held by the device"""
+        for task in self._background:
+            task.cancel()
+        if self._local_adapter is not None:
+            await self._local_adapter.async_close()
+
     async def async_force_update(self):
         """Force info refresh"""
         return await self.async_refresh_device_info()
@@ -362,6 +658,10 @@ class MelViewDevice:
         """Get customised device name"""
         return self._friendlyname
 
+    def get_building_id(self):
+        """Get building ID"""
+        return self._buildingid
+
     async def async_get_precision_halves(self) -> bool:
         """Get unit support for half-degree steps"""
         if not await self.async_is_caps_valid():
@@ -431,13 +731,24 @@ class MelViewDevice:
 
         return self._json["power"]
 
-    async def async_set_temperature(self, temperature):
-        """Set the target temperature"""
-        mode = await self.async_get_mode()
+    def _cached_power(self):
+        """Return power state from the cached snapshot, without fetching"""
+        return bool(self._json and self._json.get("power"))
+
+    def _cached_mode(self):
+        """Return the set mode from the cached snapshot, without fetching"""
+        if self._json is not None:
+            for key, val in MODE.items():
+                if self._json.get("setmode") == val:
+                    return key
+        return HVACMode.AUTO
+
+    def _validate_temperature(self, temperature, mode):
+        """Check a target temperature against the cached range for a mode"""
         temp_range = self.temp_ranges.get(mode)
         if not temp_range:
-            _LOGGER.warning("No temperature range available for mode %s", mode.value)
-            return await self.async_send_command("TS{:.2f}".format(temperature))
+            _LOGGER.warning("No temperature range available for mode %s", mode)
+            return True
         min_temp = temp_range["min"]
         max_temp = temp_range["max"]
         if temperature < min_temp:
@@ -456,47 +767,79 @@ class MelViewDevice:
                 mode,
             )
             return False
-        return await self.async_send_command("TS{:.2f}".format(temperature))
+        return True
+
+    async def _async_send_commands(self, commands, power_on=False):
+        """Send commands as one request, powering on first if the unit is off"""
+        if power_on and not self._cached_power():
+            commands = ["PW1", *commands]
+        return await self.async_send_command(",".join(commands))
+
+    async def async_apply(self, mode=None, temperature=None, speed=None):
+        """Set mode, target temperature and fan speed in a single command.
+
+        Validation uses the cached state and capabilities only. Setting a
+        mode or fan speed on a unit that is off also powers it on.
+        """
+        commands = []
+        if mode is not None:
+            if mode not in MODE:
+                _LOGGER.error("Mode %s not supported", mode)
+                return False
+            commands.append(f"MD{MODE[mode]}")
+        if temperature is not None:
+            if not self._validate_temperature(
+                temperature, mode if mode is not None else self._cached_mode()
+            ):
+                return False
+            commands.append("TS{:.2f}".format(temperature))
+        if speed is not None:
+            if speed not in self.fan_keyed:
+                _LOGGER.error("Fan speed %s not supported", speed)
+                return False
+            commands.append("FS{:.2f}".format(self.fan_keyed[speed]))
+        if not commands:
+            return True
+        return await self._async_send_commands(
+            commands, power_on=mode is not None or speed is not None
+        )
+
+    async def async_set_temperature(self, temperature):
+        """Set the target temperature"""
+        return await self.async_apply(temperature=temperature)
 
     async def async_set_speed(self, speed):
         """Set the fan speed by label (fan stage name)."""
-        if not await self.async_is_power_on():
-            if not await self.async_power_on():
-                return False
-        if speed not in self.fan_keyed.keys():
-            _LOGGER.error("Fan speed %d not supported", speed)
-            return False
-        return await self.async_send_command("FS{:.2f}".format(self.fan_keyed[speed]))
+        return await self.async_apply(speed=speed)
 
     async def async_set_speed_code(self, speed_code):
         """Set the fan speed by code (fan stage integer)."""
-        if not await self.async_is_power_on():
-            if not await self.async_power_on():
-                return False
         if speed_code not in self.fan.keys():
             _LOGGER.error("Fan speed code %d not supported", speed_code)
             return False
-        return await self.async_send_command("FS{:.2f}".format(speed_code))
+        return await self._async_send_commands(
+            ["FS{:.2f}".format(speed_code)], power_on=True
+        )
 
     async def async_set_mode(self, mode):
         """Set operating mode"""
-        if not await self.async_is_power_on():
-            if not await self.async_power_on():
-                return False
-
-        if mode not in MODE:
-            _LOGGER.error("Mode %s not supported", mode)
-            return False
-
-        return await self.async_send_command(f"MD{MODE[mode]}")
+        return await self.async_apply(mode=mode)
 
     async def async_enable_zone(self, zoneid):
         """Turn on a zone"""
-        return await self.async_send_command(f"Z{zoneid}1")
+        return await self.async_set_zones({zoneid: True})
 
     async def async_disable_zone(self, zoneid):
         """Turn off a zone"""
-        return await self.async_send_command(f"Z{zoneid}0")
+        return await self.async_set_zones({zoneid: False})
+
+    async def async_set_zones(self, zones):
+        """Turn several zones on or off in one combined command"""
+        if not zones:
+            return True
+        return await self.async_send_command(
+            ",".join(f"Z{zoneid}{int(bool(on))}" for zoneid, on in zones.items())
+        )
 
     async def async_power_on(self):
         """Turn on the unit"""
@@ -512,7 +855,7 @@ class MelViewDevice:
         if code is None:
             _LOGGER.error("Unknown Lossnay preset: %s", preset_name)
             return False
-        return await self.async_send_command(f"MD{code}")
+        return await self._async_send_commands([f"MD{code}"], power_on=True)
 
 
 class MelView:
@@ -523,14 +866,20 @@ class MelView:
         self._unitcount = 0
         self._localcontrol = localcontrol
 
-    async def async_get_devices_list(self, retry=True):
-        """Return all the devices found, as handlers"""
+    @profiled("api.devices_list")
+    async def async_get_devices_list(self, retry=True, profiler=None):
+        """Return all the devices found, as handlers.
+
+        An optional profiler's ``phase(name)`` context manager is used to
+        time the room list request.
+        """
         devices = []
+        phase = profiler.phase("rooms") if profiler is not None else nullcontext()
 
-        async with ClientSession() as session:
+        async with phase, async_span("rooms"), ClientSession() as session:
             try:
                 req = await session.post(
-                    "https://api.melview.net/api/rooms.aspx",
+                    self._authentication.get_url("rooms.aspx"),
                     json={"unitid": 0},
                     headers=HEADERS,
                     cookies=self._authentication.get_cookie(),
@@ -538,6 +887,7 @@ class MelView:
             except Exception as err:
                 _LOGGER.error("Device list request failed: %s", err)
                 return None
+        self._authentication.record_response(len(await req.read()))
         if req.status == 200:
             reply = await req.json()
             for building in reply:
@@ -549,17 +899,37 @@ class MelView:
                         self._authentication,
                         self._localcontrol,
                     )
-                    await device.async_refresh()
                     devices.append(device)
             return devices
 
         if req.status == 401 and retry:
             _LOGGER.error("Device list error 401 (trying to re-login)")
             if await self._authentication.async_login():
-                return await self.async_get_devices_list(retry=False)
+                return await self.async_get_devices_list(
+                    retry=False, profiler=profiler
+                )
 
         _LOGGER.error(
             "Failed to get device list (status code invalid: %d)", req.status
         )
 
         return None
+
+    def restore_devices(self, snapshots):
+        """Return device handlers rebuilt from persisted snapshots
+
+        Units without saved caps and state start empty, as from the API.
+        """
+        devices = []
+        for unit in snapshots:
+            device = MelViewDevice(
+                unit["unitid"],
+                unit["buildingid"],
+                unit["name"],
+                self._authentication,
+                self._localcontrol,
+            )
+            if unit.get("caps") is not None:
+                device.restore(unit["caps"], unit["state"])
+            devices.append(device)
+        return devices
@@ -0,0 +1,208 @@
+"""On-demand profiling of MelView polls, API requests and state writes.
+
+Hot paths are wrapped with ``profiled``; while no session runs the wrapper
+costs a single flag check. A session, started by the ``start_profiling``
+service for a bounded window, times every wrapped call and additionally
+either runs cProfile on the event loop thread ("deterministic") or samples
+the event loop thread's stack from a background thread ("sampling").
+"""
+
+from __future__ import annotations
+
+import asyncio
+import cProfile
+import functools
+import inspect
+import io
+import logging
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+MODE_SAMPLING = "sampling"
+MODE_DETERMINISTIC = "deterministic"
+SAMPLE_INTERVAL = 0.005
+
+_PACKAGE_DIR = str(Path(__file__).parent)
+
+_session: ProfileSession | None = None
+
+
+def is_active() -> bool:
+    """Return True while a profiling session is running."""
+    return _session is not None
+
+
+def profiled(name: str):
+    """Time calls of a sync or async function while profiling is active."""
+
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if _session is None:
+                    return await func(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    if _session is not None:
+                        _session.record(name, time.perf_counter() - start)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _session is None:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                if _session is not None:
+                    _session.record(name, time.perf_counter() - start)
+
+        return wrapper
+
+    return decorator
+
+
+class ProfileSession:
+    """Collect call timings plus cProfile stats or stack samples."""
+
+    def __init__(self, mode: str) -> None:
+        self.mode = mode
+        self.calls: dict[str, list[float]] = {}  # name -> [count, total, max]
+        self.samples: Counter[tuple[tuple[str, str, int], ...]] = Counter()
+        self._profiler: cProfile.Profile | None = None
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+        self._started = 0.0
+        self.elapsed = 0.0
+
+    def record(self, name: str, elapsed: float) -> None:
+        stats = self.calls.get(name)
+        if stats is None:
+            self.calls[name] = [1, elapsed, elapsed]
+        else:
+            stats[0] += 1
+            stats[1] += elapsed
+            stats[2] = max(stats[2], elapsed)
+
+    def start(self) -> None:
+        """Start profiling the calling (event loop) thread."""
+        self._started = time.perf_counter()
+        if self.mode == MODE_DETERMINISTIC:
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        else:
+            self._thread = threading.Thread(
+                target=self._sample,
+                args=(threading.get_ident(),),
+                name="melview_profiler",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop profiling; must run on the thread that called start."""
+        self.elapsed = time.perf_counter() - self._started
+        if self._profiler is not None:
+            self._profiler.disable()
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+
+    def _sample(self, ident: int) -> None:
+        while not self._stop.wait(SAMPLE_INTERVAL):
+            frame = sys._current_frames().get(ident)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append((code.co_filename, code.co_name, code.co_firstlineno))
+                frame = frame.f_back
+            self.samples[tuple(reversed(stack))] += 1
+
+    def write(self, base: Path, top: int) -> str:
+        """Write the collected data next to ``base`` and return a summary."""
+        lines = [
+            f"MelView {self.mode} profile over {self.elapsed:.1f}s",
+            "",
+            f"{'hook':<28} {'calls':>7} {'total ms':>10} {'mean ms':>9} "
+            f"{'max ms':>9}",
+        ]
+        for name, (count, total, peak) in sorted(
+            self.calls.items(), key=lambda item: item[1][1], reverse=True
+        ):
+            lines.append(
+                f"{name:<28} {count:>7} {total * 1e3:>10.1f} "
+                f"{total / count * 1e3:>9.2f} {peak * 1e3:>9.1f}"
+            )
+        lines.append("")
+        if self._profiler is not None:
+            self._profiler.dump_stats(base.with_suffix(".prof"))
+            out = io.StringIO()
+            stats = pstats.Stats(self._profiler, stream=out)
+            stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats("melview", top)
+            lines.append(out.getvalue().strip())
+        else:
+            lines.extend(self._sample_summary(base, top))
+        summary = "\n".join(lines)
+        base.with_suffix(".txt").write_text(summary + "\n", encoding="utf-8")
+        return summary
+
+    def _sample_summary(self, base: Path, top: int) -> list[str]:
+        """Write collapsed stacks and summarise inclusive samples per function."""
+        total = sum(self.samples.values())
+        inclusive: Counter[tuple[str, str, int]] = Counter()
+        with base.with_suffix(".folded").open("w", encoding="utf-8") as file:
+            for stack, count in self.samples.items():
+                file.write(
+                    ";".join(f"{Path(f).name}:{name}" for f, name, _ in stack)
+                    + f" {count}\n"
+                )
+                for frame in set(stack):
+                    if frame[0].startswith(_PACKAGE_DIR) and frame[0] != __file__:
+                        inclusive[frame] += count
+        lines = [f"{total} samples, melview functions by inclusive samples:"]
+        for (filename, name, line), count in inclusive.most_common(top):
+            lines.append(
+                f"{count:>7} {count / total:>6.1%}  "
+                f"{Path(filename).name}:{line}({name})"
+            )
+        return lines
+
+
+async def async_run(
+    hass: HomeAssistant, duration: float, mode: str, top: int
+) -> Path:
+    """Profile for ``duration`` seconds, write results and log a summary."""
+    global _session
+    if _session is not None:
+        raise RuntimeError("Profiling is already running")
+    session = ProfileSession(mode)
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    base = Path(hass.config.path(f"melview_profile_{stamp}"))
+    _LOGGER.info("Starting %s profiling for %.0fs", mode, duration)
+    # Fails if another profiler is already active on this thread.
+    session.start()
+    _session = session
+    try:
+        await asyncio.sleep(duration)
+    finally:
+        session.stop()
+        _session = None
+    summary = await hass.async_add_executor_job(session.write, base, top)
+    _LOGGER.info("%s\n\nWritten to %s.*", summary, base)
+    return base
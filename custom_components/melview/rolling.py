@@ -0,0 +1,82 @@
+"""Time-bounded rolling window statistics for MelView readings."""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+
+
+class RollingWindow:
+    """Samples from the last ``max_age`` seconds with O(1) min, max and mean.
+
+    At most ``size`` samples are kept. Min and max are kept in monotonic
+    deques, so each push is amortised O(1). Samples older than ``max_age``
+    are evicted on push and before every read, so gaps in polling shrink
+    the window instead of stretching it back in time.
+    """
+
+    __slots__ = ("_size", "_max_age", "_samples", "_seq", "_sum", "_min", "_max")
+
+    def __init__(self, size: int, max_age: float) -> None:
+        self._size = size
+        self._max_age = max_age
+        self._samples: deque[tuple[int, float, float]] = deque()
+        self._seq = 0
+        self._sum = 0.0
+        self._min: deque[tuple[int, float]] = deque()
+        self._max: deque[tuple[int, float]] = deque()
+
+    def __len__(self) -> int:
+        self._expire(time.monotonic())
+        return len(self._samples)
+
+    def push(self, value: float, now: float | None = None) -> None:
+        """Add a sample taken at monotonic time ``now``."""
+        if now is None:
+            now = time.monotonic()
+        self._expire(now)
+        if len(self._samples) == self._size:
+            self._evict()
+        seq = self._seq
+        self._seq = seq + 1
+        self._samples.append((seq, now, value))
+        if seq % self._size == self._size - 1:
+            # Resync once per lap so float rounding cannot accumulate.
+            self._sum = sum(sample[2] for sample in self._samples)
+        else:
+            self._sum += value
+        while self._min and self._min[-1][1] >= value:
+            self._min.pop()
+        self._min.append((seq, value))
+        while self._max and self._max[-1][1] <= value:
+            self._max.pop()
+        self._max.append((seq, value))
+
+    def _evict(self) -> None:
+        seq, _, value = self._samples.popleft()
+        if self._samples:
+            self._sum -= value
+        else:
+            self._sum = 0.0
+        if self._min and self._min[0][0] <= seq:
+            self._min.popleft()
+        if self._max and self._max[0][0] <= seq:
+            self._max.popleft()
+
+    def _expire(self, now: float) -> None:
+        cutoff = now - self._max_age
+        while self._samples and self._samples[0][1] < cutoff:
+            self._evict()
+
+    @property
+    def min(self) -> float | None:
+        return self._min[0][1] if len(self) else None
+
+    @property
+    def max(self) -> float | None:
+        return self._max[0][1] if len(self) else None
+
+    @property
+    def mean(self) -> float | None:
+        count = len(self)
+        return self._sum / count if count else None
@@ -8,11 +8,16 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import PERCENTAGE, UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    PERCENTAGE,
+    EntityCategory,
+    UnitOfTemperature,
+    UnitOfTime,
+)
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import CONF_SENSOR
+from .const import CONF_ROLLING, CONF_SENSOR
 from .entity import MelViewBaseEntity
 
 _LOGGER = logging.getLogger(__name__)
@@ -23,36 +28,73 @@ async def async_setup_entry(
     entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
-    """Set up MelView temperature sensors from a config entry."""
-    if not entry.options.get(CONF_SENSOR, True):
+    """Set up MelView temperature and diagnostic sensors from a config entry."""
+    sensor = entry.options.get(CONF_SENSOR, True)
+    if not sensor:
         _LOGGER.debug("Sensor option is disabled in config entry.")
-        return
-
-    coordinators = entry.runtime_data
 
-    entities = [MelViewCurrentTempSensor(coordinator) for coordinator in coordinators]
-    for coordinator in coordinators:
-        if coordinator.device.get_unit_type() == "ERV":
+    rolling = entry.options.get(CONF_ROLLING, False)
+
+    @callback
+    def _async_add_unit(coordinator) -> None:
+        entities = [
+            MelViewDataAgeSensor(coordinator),
+            MelViewPollLagSensor(coordinator),
+        ]
+        if sensor:
+            entities.append(MelViewCurrentTempSensor(coordinator, rolling))
+        if sensor and coordinator.device.get_unit_type() == "ERV":
             entities.extend(
                 [
-                    MelViewOutdoorTempSensor(coordinator),
+                    MelViewOutdoorTempSensor(coordinator, rolling),
                     MelViewSupplyTempSensor(coordinator),
-                    MelViewExhaustTempSensor(coordinator),
-                    MelViewCoreEfficiencySensor(coordinator),
+                    MelViewExhaustTempSensor(coordinator, rolling),
+                    MelViewCoreEfficiencySensor(coordinator, rolling),
                 ]
             )
-    async_add_entities(entities, update_before_add=True)
+        async_add_entities(entities)
+
+    for coordinator in entry.runtime_data:
+        coordinator.async_when_ready(_async_add_unit)
 
 
-class MelViewCurrentTempSensor(MelViewBaseEntity, SensorEntity):
+class MelViewRollingSensor(MelViewBaseEntity, SensorEntity):
+    """Sensor that can expose 1-hour rolling statistics of its reading."""
+
+    _rolling_key: str
+    _rolling_scale = 1.0
+
+    def __init__(self, coordinator, rolling: bool = False):
+        super().__init__(coordinator, coordinator.device)
+        self._rolling = rolling
+
+    @property
+    def extra_state_attributes(self):
+        """Add rolling min, max and mean from the coordinator's ring buffer."""
+        attrs = super().extra_state_attributes
+        window = self.coordinator.rolling.get(self._rolling_key)
+        if not self._rolling or not window:
+            return attrs
+        scale = self._rolling_scale
+        return {
+            **(attrs or {}),
+            "min_1h": round(window.min * scale, 1),
+            "max_1h": round(window.max * scale, 1),
+            "mean_1h": round(window.mean * scale, 1),
+            "samples_1h": len(window),
+        }
+
+
+class MelViewCurrentTempSensor(MelViewRollingSensor):
     """Sensor representing the current room temperature for a MelView device."""
 
     _attr_has_entity_name = True
     _attr_name = "Current Temperature"
+    _rolling_key = "roomtemp"
 
-    def __init__(self, coordinator):
+    def __init__(self, coordinator, rolling: bool = False):
         """Initialize sensor, tied to a DataUpdateCoordinator."""
-        super().__init__(coordinator, coordinator.device)
+        super().__init__(coordinator, rolling)
         api = coordinator.device
         self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
         self._attr_state_class = SensorStateClass.MEASUREMENT
@@ -67,14 +109,15 @@ class MelViewCurrentTempSensor(MelViewBaseEntity, SensorEntity):
         return float(data.get("roomtemp", 0))
 
 
-class MelViewOutdoorTempSensor(MelViewBaseEntity, SensorEntity):
+class MelViewOutdoorTempSensor(MelViewRollingSensor):
     """Sensor representing the outdoor (fresh air) temperature."""
 
     _attr_has_entity_name = True
     _attr_name = "Fresh Air"
+    _rolling_key = "outdoortemp"
 
-    def __init__(self, coordinator):
-        super().__init__(coordinator, coordinator.device)
+    def __init__(self, coordinator, rolling: bool = False):
+        super().__init__(coordinator, rolling)
         api = coordinator.device
         self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
         self._attr_state_class = SensorStateClass.MEASUREMENT
@@ -110,14 +153,15 @@ class MelViewSupplyTempSensor(MelViewBaseEntity, SensorEntity):
         return round(outdoor + efficiency * (room - outdoor), 1)
 
 
-class MelViewExhaustTempSensor(MelViewBaseEntity, SensorEntity):
+class MelViewExhaustTempSensor(MelViewRollingSensor):
     """Sensor for the stale air temperature leaving the unit."""
 
     _attr_has_entity_name = True
     _attr_name = "Stale Air"
+    _rolling_key = "exhausttemp"
 
-    def __init__(self, coordinator):
-        super().__init__(coordinator, coordinator.device)
+    def __init__(self, coordinator, rolling: bool = False):
+        super().__init__(coordinator, rolling)
         api = coordinator.device
         self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
         self._attr_state_class = SensorStateClass.MEASUREMENT
@@ -130,14 +174,16 @@ class MelViewExhaustTempSensor(MelViewBaseEntity, SensorEntity):
         return float(data.get("exhausttemp", 0))
 
 
-class MelViewCoreEfficiencySensor(MelViewBaseEntity, SensorEntity):
+class MelViewCoreEfficiencySensor(MelViewRollingSensor):
     """Sensor for the core heat recovery efficiency percentage."""
 
     _attr_has_entity_name = True
     _attr_name = "Core Efficiency"
+    _rolling_key = "coreefficiency"
+    _rolling_scale = 100.0
 
-    def __init__(self, coordinator):
-        super().__init__(coordinator, coordinator.device)
+    def __init__(self, coordinator, rolling: bool = False):
+        super().__init__(coordinator, rolling)
         api = coordinator.device
         self._attr_native_unit_of_measurement = PERCENTAGE
         self._attr_state_class = SensorStateClass.MEASUREMENT
@@ -147,3 +193,60 @@ class MelViewCoreEfficiencySensor(MelViewBaseEntity, SensorEntity):
     def native_value(self):
         data = self.coordinator.data or {}
         return round(float(data.get("coreefficiency", 0)) * 100, 1)
+
+
+class MelViewWatchdogSensor(MelViewBaseEntity, SensorEntity):
+    """Diagnostic timing sensor, polled so it keeps counting while polls fail."""
+
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_native_unit_of_measurement = UnitOfTime.SECONDS
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(self, coordinator):
+        super().__init__(coordinator, coordinator.device)
+
+    @property
+    def should_poll(self) -> bool:
+        return True
+
+    @property
+    def available(self) -> bool:
+        return True
+
+    async def async_update(self) -> None:
+        """Re-read the coordinator's timings without refreshing the unit."""
+
+
+class MelViewDataAgeSensor(MelViewWatchdogSensor):
+    """Seconds since the unit's data was last refreshed successfully."""
+
+    _attr_name = "Data Age"
+    _attr_suggested_display_precision = 0
+
+    def __init__(self, coordinator):
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{coordinator.device.get_id()}_data_age"
+
+    @property
+    def native_value(self):
+        age = self.coordinator.data_age()
+        return round(age) if age is not None else None
+
+
+class MelViewPollLagSensor(MelViewWatchdogSensor):
+    """Delay between when the last scheduled poll was due and when it ran."""
+
+    _attr_name = "Poll Lag"
+    _attr_suggested_display_precision = 1
+
+    def __init__(self, coordinator):
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{coordinator.device.get_id()}_poll_lag"
+
+    @property
+    def native_value(self):
+        lag = self.coordinator.poll_lag
+        return round(lag, 1) if lag is not None else None
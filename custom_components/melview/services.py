@@ -0,0 +1,163 @@
+"""Services for the MelView integration."""
+
+from __future__ import annotations
+
+import voluptuous as vol
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+import homeassistant.helpers.config_validation as cv
+
+from . import profiling
+from .const import DOMAIN
+from .coordinator import MelViewCoordinator
+from .melview import LOSSNAY_PRESETS, MODE
+
+SERVICE_GET_SNAPSHOT = "get_snapshot"
+SERVICE_START_PROFILING = "start_profiling"
+
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_BUILDING_ID = "building_id"
+ATTR_UNIT_TYPE = "unit_type"
+ATTR_DURATION = "duration"
+ATTR_MODE = "mode"
+ATTR_TOP = "top"
+
+GET_SNAPSHOT_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_BUILDING_ID): cv.string,
+        vol.Optional(ATTR_UNIT_TYPE): cv.string,
+    }
+)
+
+START_PROFILING_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_DURATION, default=60): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=3600)
+        ),
+        vol.Optional(ATTR_MODE, default=profiling.MODE_SAMPLING): vol.In(
+            [profiling.MODE_SAMPLING, profiling.MODE_DETERMINISTIC]
+        ),
+        vol.Optional(ATTR_TOP, default=20): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=200)
+        ),
+    }
+)
+
+
+def _float(value) -> float | None:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _unit_snapshot(coordinator: MelViewCoordinator) -> dict:
+    """Summarise a unit from the coordinator's cached state."""
+    device = coordinator.device
+    data = coordinator.data or {}
+    # Lossnay units report their ventilation preset in setmode.
+    modes = LOSSNAY_PRESETS if device.get_unit_type() == "ERV" else MODE
+    mode = next(
+        (name for name, code in modes.items() if code == data.get("setmode")), None
+    )
+    age = coordinator.data_age()
+    return {
+        "unit_id": device.get_id(),
+        "name": device.get_friendly_name(),
+        "building_id": device.get_building_id(),
+        "unit_type": device.get_unit_type(),
+        "available": coordinator.last_update_success,
+        "stale": coordinator.stale,
+        "data_age": round(age, 1) if age is not None else None,
+        "power": bool(data.get("power")) if data else None,
+        "mode": mode,
+        "set_temperature": _float(data.get("settemp")),
+        "room_temperature": _float(data.get("roomtemp")),
+        "fan": device.fan.get(data.get("setfan")),
+        "zones": [
+            {"id": zone.id, "name": zone.name, "on": bool(zone.status)}
+            for zone in device.get_zones()
+        ],
+        "fault": data.get("fault") or None,
+        "error": data.get("error"),
+    }
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the MelView services."""
+
+    @callback
+    def async_get_snapshot(call: ServiceCall) -> ServiceResponse:
+        """Return cached state of every matching unit without calling the API."""
+        entry_id = call.data.get(ATTR_CONFIG_ENTRY_ID)
+        building_id = call.data.get(ATTR_BUILDING_ID)
+        unit_type = call.data.get(ATTR_UNIT_TYPE)
+        entries = [
+            entry
+            for entry in hass.config_entries.async_entries(DOMAIN)
+            if entry.state is ConfigEntryState.LOADED
+            and entry_id in (None, entry.entry_id)
+        ]
+        if entry_id is not None and not entries:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="entry_not_loaded",
+                translation_placeholders={"entry_id": entry_id},
+            )
+        units = [
+            _unit_snapshot(coordinator)
+            for entry in entries
+            for coordinator in entry.runtime_data
+            if (
+                building_id is None
+                or str(coordinator.device.get_building_id()) == building_id
+            )
+            and (
+                unit_type is None
+                or (coordinator.device.get_unit_type() or "").upper()
+                == unit_type.upper()
+            )
+        ]
+        return {"units": units}
+
+    @callback
+    def async_start_profiling(call: ServiceCall) -> None:
+        """Profile MelView for a bounded window in the background."""
+        if profiling.is_active():
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="profiling_active",
+            )
+        hass.async_create_background_task(
+            profiling.async_run(
+                hass,
+                call.data[ATTR_DURATION],
+                call.data[ATTR_MODE],
+                call.data[ATTR_TOP],
+            ),
+            f"{DOMAIN}_profiling",
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_SNAPSHOT,
+        async_get_snapshot,
+        schema=GET_SNAPSHOT_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_START_PROFILING,
+        async_start_profiling,
+        schema=START_PROFILING_SCHEMA,
+    )
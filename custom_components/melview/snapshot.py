@@ -0,0 +1,82 @@
+"""Persisted per-unit state snapshot for fast MelView startup."""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timezone
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+from .melview import MelViewDevice
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 60
+
+
+class MelViewSnapshotStore:
+    """Keep the last known capabilities and state of every unit on disk."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._store: Store = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.snapshot"
+        )
+        self._units: dict[str, dict] = {}
+        self._rooms: list[dict] = []
+
+    @property
+    def rooms(self) -> list[dict]:
+        """Return every unit of the account, polled successfully or not."""
+        return self._rooms
+
+    async def async_load(self) -> dict[str, dict]:
+        """Load persisted unit snapshots, keyed by unit id."""
+        data = await self._store.async_load() or {}
+        self._units = data.get("units", {})
+        # Snapshots saved before the unit list was stored only know their units.
+        self._rooms = data.get("rooms") or [
+            {key: unit[key] for key in ("unitid", "buildingid", "name")}
+            for unit in self._units.values()
+        ]
+        _LOGGER.debug(
+            "Loaded state snapshot for %d of %d unit(s)",
+            len(self._units),
+            len(self._rooms),
+        )
+        return self._units
+
+    @callback
+    def async_set_rooms(self, devices: list[MelViewDevice]) -> None:
+        """Record the account's unit list and schedule a save."""
+        self._rooms = [
+            {
+                "unitid": device.get_id(),
+                "buildingid": device.get_building_id(),
+                "name": device.get_friendly_name(),
+            }
+            for device in devices
+        ]
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def async_update(self, device: MelViewDevice) -> None:
+        """Record the current state of a unit and schedule a save."""
+        snapshot = device.snapshot()
+        if snapshot["caps"] is None or snapshot["state"] is None:
+            return
+        snapshot["updated"] = datetime.now(timezone.utc).isoformat()
+        self._units[str(device.get_id())] = snapshot
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    async def async_clear(self) -> None:
+        """Forget all snapshots, e.g. when the unit list has changed."""
+        self._units = {}
+        self._rooms = []
+        await self._store.async_remove()
+
+    @callback
+    def _data_to_save(self) -> dict:
+        return {"units": self._units, "rooms": self._rooms}
@@ -0,0 +1,77 @@
+"""Startup phase timing for MelView config entries."""
+
+from __future__ import annotations
+
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+
+from .melview import MelViewAuthentication
+
+
+class StartupProfiler:
+    """Record a per-phase and per-unit timing waterfall of one setup run."""
+
+    def __init__(self, authentication: MelViewAuthentication) -> None:
+        self._authentication = authentication
+        self._t0 = time.monotonic()
+        self.started = datetime.now(timezone.utc).isoformat()
+        self.phases: list[dict] = []
+        self.total: float | None = None
+
+    @asynccontextmanager
+    async def phase(self, name: str, unit=None, source=None):
+        """Time a phase and count the requests and bytes it caused.
+
+        Counts come from the account's authentication, or from ``source``
+        (e.g. a ``MelViewDevice``) for per-unit phases that run
+        concurrently and would otherwise share the account counters.
+        """
+        counter = source if source is not None else self._authentication
+        start = time.monotonic()
+        requests, received = counter.request_count, counter.bytes_received
+        try:
+            yield
+        finally:
+            end = time.monotonic()
+            self.phases.append(
+                {
+                    "phase": name,
+                    "unit": unit,
+                    "start": round(start - self._t0, 3),
+                    "end": round(end - self._t0, 3),
+                    "requests": counter.request_count - requests,
+                    "bytes": counter.bytes_received - received,
+                }
+            )
+
+    def finish(self) -> None:
+        """Mark the run as complete."""
+        self.total = round(time.monotonic() - self._t0, 3)
+
+    def summary(self) -> str:
+        """Return a one-line summary, grouping per-unit phases."""
+        totals: dict[str, list] = {}
+        for phase in self.phases:
+            entry = totals.setdefault(phase["phase"], [0, 0.0])
+            entry[0] += 1
+            entry[1] += phase["end"] - phase["start"]
+        parts = []
+        for name, (count, duration) in totals.items():
+            if count > 1:
+                name = f"{name} {count}x"
+            parts.append(f"{name} {duration:.2f}s")
+        return "{}; total {}s, {} requests, {} bytes".format(
+            ", ".join(parts),
+            self.total,
+            self._authentication.request_count,
+            self._authentication.bytes_received,
+        )
+
+    def as_dict(self) -> dict:
+        """Return the waterfall for diagnostics."""
+        return {
+            "started": self.started,
+            "total": self.total,
+            "phases": list(self.phases),
+        }
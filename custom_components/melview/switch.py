@@ -1,9 +1,11 @@
 import logging
 
 from homeassistant.components.switch import SwitchEntity
+from homeassistant.core import callback
 
 from .coordinator import MelViewCoordinator
 from .entity import MelViewBaseEntity
+from .tracing import traced
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -16,42 +18,72 @@ class MelViewZoneSwitch(MelViewBaseEntity, SwitchEntity):
         self._id = zone.id
         self._attr_unique_id = f"{self.coordinator.get_id()}-{self._id}"
         self._attr_name = f"Zone {zone.name}"
+        self._written: tuple[bool, bool] | None = None
+
+    @property
+    def available(self) -> bool:
+        """Return False if the zone is no longer reported by the unit."""
+        return super().available and self.coordinator.get_zone(self._id) is not None
 
     @property
     def is_on(self) -> bool:
         """Check if the zone is currently on."""
         zone = self.coordinator.get_zone(self._id)
-        return bool(zone.status)
+        return bool(zone and zone.status)
 
     @property
     def extra_state_attributes(self):
         """Return spill status as attribute."""
         zone = self.coordinator.get_zone(self._id)
         return {
-            "Spill active": zone.status == 2,
+            **(super().extra_state_attributes or {}),
+            "Spill active": zone is not None and zone.status == 2,
         }
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Only write state when the zone, availability or staleness changed."""
+        zone = self.coordinator.get_zone(self._id)
+        written = (self.available, self.coordinator.stale)
+        if zone is not None and not zone.changed and written == self._written:
+            return
+        self._written = written
+        super()._handle_coordinator_update()
+
+    @traced("switch.turn_on")
     async def async_turn_on(self):
         """Turn on the zone"""
         _LOGGER.debug("Switch on zone %s", self._attr_name)
-        if await self.coordinator.async_enable_zone(self._id):
-            await self.coordinator.async_refresh()
+        await self.coordinator.async_set_zone(self._id, True)
 
+    @traced("switch.turn_off")
     async def async_turn_off(self):
         """Turn off the zone"""
         _LOGGER.debug("Switch off zone %s", self._attr_name)
-        if await self.coordinator.async_disable_zone(self._id):
-            await self.coordinator.async_refresh()
+        await self.coordinator.async_set_zone(self._id, False)
 
 
 async def async_setup_entry(hass, entry, async_add_entities) -> None:
     """Set up MelView device climate based on config_entry."""
-    coordinators = entry.runtime_data
 
-    entities = [
-        MelViewZoneSwitch(coordinator, zone)
-        for coordinator in coordinators
-        for zone in coordinator.get_zones()
-    ]
+    @callback
+    def _async_add_unit(coordinator: MelViewCoordinator) -> None:
+        if coordinator.device._json is not None:
+            async_add_entities(
+                MelViewZoneSwitch(coordinator, zone)
+                for zone in coordinator.get_zones()
+            )
+            return
+
+        # Zones are only reported with unit state; wait for the first poll.
+        @callback
+        def _async_state_received() -> None:
+            if coordinator.device._json is not None:
+                remove_listener()
+                _async_add_unit(coordinator)
+
+        remove_listener = coordinator.async_add_listener(_async_state_received)
+        entry.async_on_unload(remove_listener)
 
-    async_add_entities(entities, update_before_add=True)
+    for coordinator in entry.runtime_data:
+        coordinator.async_when_ready(_async_add_unit)
@@ -0,0 +1,246 @@
+"""Compact rotating log of raw MelView unit payloads.
+
+Each poll's full ``unitcommand.aspx`` payload is delta-encoded against the
+unit's previous one and appended, as one JSON line, to gzip files that
+rotate by size. Records are buffered in memory (bounded) and written from
+the executor.
+
+Record format (one per line)::
+
+    {"t": 1700000000.0, "u": "123", "f": {...}}      full payload
+    {"t": 1700000030.0, "u": "123", "d": {...}, "r": [...]}  changed / removed keys
+
+Read records back with ``read_records`` or from the command line::
+
+    python telemetry.py /config/melview_telemetry/<entry_id> --unit 123 \\
+        --start 2026-01-01T00:00:00 --end 2026-01-02T00:00:00
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import logging
+import time
+from collections import deque
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+MAX_FILE_BYTES = 5 * 1024 * 1024
+MAX_FILES = 20
+BUFFER_RECORDS = 2000  # Oldest records are dropped beyond this.
+FLUSH_RECORDS = 500  # Flush early once this many records are buffered.
+FLUSH_INTERVAL = timedelta(seconds=60)
+FILE_GLOB = "telemetry-*.jsonl.gz"
+
+
+class TelemetryWriter:
+    """Buffer delta-encoded unit payloads and write them off the event loop."""
+
+    def __init__(self, hass: HomeAssistant, directory: str | Path) -> None:
+        self._hass = hass
+        self._dir = Path(directory)
+        self._buffer: deque[dict] = deque()
+        self._previous: dict[str, dict] = {}
+        self._flushing = False
+        self._unsub = None
+        self._unsub_stop = None
+        self._current: Path | None = None
+        self.records = 0
+        self.dropped = 0
+
+    def async_start(self) -> None:
+        """Start periodic flushing, and flush when Home Assistant stops."""
+        from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+        from homeassistant.helpers.event import async_track_time_interval
+
+        self._unsub = async_track_time_interval(
+            self._hass, self._async_flush_interval, FLUSH_INTERVAL
+        )
+        # Config entries are not unloaded on shutdown.
+        self._unsub_stop = self._hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STOP, self._async_on_hass_stop
+        )
+
+    async def _async_on_hass_stop(self, _event) -> None:
+        self._unsub_stop = None
+        await self.async_stop()
+
+    async def async_stop(self) -> None:
+        """Stop periodic flushing and write out anything buffered."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+        if self._unsub_stop is not None:
+            self._unsub_stop()
+            self._unsub_stop = None
+        await self.async_flush()
+
+    def async_record(self, unit_id, payload: dict) -> None:
+        """Buffer a unit payload; unchanged payloads are not recorded."""
+        unit = str(unit_id)
+        if len(self._buffer) >= BUFFER_RECORDS:
+            self._drop_oldest()
+        previous = self._previous.get(unit)
+        record: dict = {"t": round(time.time(), 3), "u": unit}
+        if previous is None:
+            record["f"] = payload
+        else:
+            changed = {
+                key: value
+                for key, value in payload.items()
+                if key not in previous or previous[key] != value
+            }
+            removed = [key for key in previous if key not in payload]
+            if not changed and not removed:
+                return
+            record["d"] = changed
+            if removed:
+                record["r"] = removed
+        self._previous[unit] = payload
+        self._buffer.append(record)
+        self.records += 1
+        if len(self._buffer) >= FLUSH_RECORDS and not self._flushing:
+            self._hass.async_create_task(self.async_flush())
+
+    def _drop_oldest(self) -> None:
+        """Drop the oldest record and the deltas of its unit chained to it."""
+        unit = self._buffer.popleft()["u"]
+        self.dropped += 1
+        kept: deque[dict] = deque()
+        chained = True
+        for record in self._buffer:
+            if chained and record["u"] == unit:
+                if "f" not in record:
+                    self.dropped += 1
+                    continue
+                chained = False
+            kept.append(record)
+        self._buffer = kept
+        if chained:
+            # Nothing buffered to build on; the unit's next record is full.
+            self._previous.pop(unit, None)
+
+    async def _async_flush_interval(self, _now) -> None:
+        await self.async_flush()
+
+    async def async_flush(self) -> None:
+        """Write buffered records in the executor."""
+        if self._flushing or not self._buffer:
+            return
+        self._flushing = True
+        records = list(self._buffer)
+        self._buffer.clear()
+        try:
+            rotated = await self._hass.async_add_executor_job(self._write, records)
+        except OSError as err:
+            _LOGGER.error("Unable to write MelView telemetry: %s", err)
+            self.dropped += len(records)
+            rotated = True
+        finally:
+            self._flushing = False
+        if rotated:
+            # Start every unit in the new file with a full payload.
+            self._previous.clear()
+
+    def _write(self, records: list[dict]) -> bool:
+        """Append records to the current file; return True if it was rotated."""
+        self._dir.mkdir(parents=True, exist_ok=True)
+        if self._current is None:
+            # Never append to a file an earlier run may have left truncated.
+            self._current = self._new_path()
+        with gzip.open(self._current, "at", encoding="utf-8") as file:
+            for record in records:
+                file.write(json.dumps(record, separators=(",", ":")))
+                file.write("\n")
+        if self._current.stat().st_size < MAX_FILE_BYTES:
+            return False
+        self._current = self._new_path()
+        for old in sorted(self._dir.glob(FILE_GLOB))[:-MAX_FILES]:
+            old.unlink(missing_ok=True)
+        return True
+
+    def _new_path(self) -> Path:
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+        return self._dir / f"telemetry-{stamp}.jsonl.gz"
+
+    def stats(self) -> dict:
+        """Return writer counters for diagnostics."""
+        return {
+            "records": self.records,
+            "dropped": self.dropped,
+            "buffered": len(self._buffer),
+        }
+
+
+def read_records(
+    directory: str | Path,
+    unit_id=None,
+    start: float | None = None,
+    end: float | None = None,
+) -> Iterator[dict]:
+    """Yield ``{"t", "unit", "payload"}`` with full payloads, oldest first.
+
+    Deltas whose base record was rotated away are skipped until the unit's
+    next full payload. A file cut short by a crash is read up to the damage;
+    state is then reset so later deltas are not applied to a stale base.
+    """
+    unit_filter = str(unit_id) if unit_id is not None else None
+    state: dict[str, dict] = {}
+    for path in sorted(Path(directory).glob(FILE_GLOB)):
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as file:
+                for line in file:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue  # Truncated final line of an interrupted write.
+                    unit = record["u"]
+                    if unit_filter is not None and unit != unit_filter:
+                        continue
+                    if end is not None and record["t"] > end:
+                        return
+                    if "f" in record:
+                        payload = record["f"]
+                    elif unit in state:
+                        payload = {**state[unit], **record["d"]}
+                        for key in record.get("r", ()):
+                            payload.pop(key, None)
+                    else:
+                        continue
+                    state[unit] = payload
+                    if start is None or record["t"] >= start:
+                        yield {"t": record["t"], "unit": unit, "payload": payload}
+        except (EOFError, OSError) as err:  # Includes gzip.BadGzipFile.
+            _LOGGER.warning("Stopped reading damaged file %s: %s", path, err)
+            state.clear()
+
+
+def _timestamp(value: str) -> float:
+    moment = datetime.fromisoformat(value)
+    if moment.tzinfo is None:
+        moment = moment.astimezone()
+    return moment.timestamp()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Print MelView telemetry records")
+    parser.add_argument("directory")
+    parser.add_argument("--unit")
+    parser.add_argument("--start", type=_timestamp, help="ISO 8601 start time")
+    parser.add_argument("--end", type=_timestamp, help="ISO 8601 end time")
+    args = parser.parse_args()
+    for record in read_records(args.directory, args.unit, args.start, args.end):
+        print(json.dumps(record, separators=(",", ":")))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""Lightweight span tracing for MelView commands and polls.
+
+Every user action or poll opens a root span whose trace id doubles as the
+correlation id; I/O steps below it (state prefetch, cloud POST, local relay,
+follow-up refresh) become child spans through a context variable. Finished
+traces are kept in small ring buffers per config entry for diagnostics.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import secrets
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+
+_LOGGER = logging.getLogger(__name__)
+
+SLOW_TRACE_SECONDS = 5.0
+RECENT_TRACES = 50
+SLOW_TRACES = 20
+
+# Root spans opened on a schedule rather than by a user action. They are
+# kept apart so frequent polls cannot push user actions out of the buffers.
+ROUTINE_ROOTS = frozenset({"poll"})
+
+_current: ContextVar[Span | None] = ContextVar("melview_span", default=None)
+# Buffers keyed by config entry id, so one account never sees another's traces.
+_traces: dict[str, dict[str, deque[dict]]] = {}
+
+
+class Span:
+    """A timed operation within a trace."""
+
+    __slots__ = (
+        "trace_id",
+        "entry_id",
+        "span_id",
+        "parent",
+        "name",
+        "attributes",
+        "start_ns",
+        "duration_ns",
+        "status",
+        "children",
+        "_perf_start",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        parent: Span | None,
+        attributes: dict,
+        entry_id: str | None = None,
+    ) -> None:
+        self.trace_id = parent.trace_id if parent else secrets.token_hex(16)
+        self.entry_id = parent.entry_id if parent else entry_id
+        self.span_id = secrets.token_hex(8)
+        self.parent = parent
+        self.name = name
+        self.attributes = attributes
+        self.start_ns = time.time_ns()
+        self.duration_ns: int | None = None
+        self.status = "ok"
+        self.children: list[Span] = []
+        self._perf_start = time.perf_counter_ns()
+
+    def finish(self) -> None:
+        self.duration_ns = time.perf_counter_ns() - self._perf_start
+
+    def as_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "span_id": self.span_id,
+            "start_ns": self.start_ns,
+            "duration_ms": round((self.duration_ns or 0) / 1e6, 2),
+            "status": self.status,
+            "attributes": self.attributes,
+            "children": [child.as_dict() for child in self.children],
+        }
+
+
+def current_trace_id() -> str | None:
+    """Return the correlation id of the active trace, if any."""
+    span = _current.get()
+    return span.trace_id if span else None
+
+
+@asynccontextmanager
+async def async_span(name: str, entry_id: str | None = None, **attributes):
+    """Time a block as a span, nested under the active span if there is one.
+
+    Root spans are kept for diagnostics of ``entry_id``; nested spans inherit
+    it. Traces not tied to an entry are only logged when slow.
+    """
+    parent = _current.get()
+    span = Span(name, parent, attributes, entry_id)
+    token = _current.set(span)
+    try:
+        yield span
+    except BaseException as err:
+        span.status = "error"
+        span.attributes["error"] = repr(err)
+        raise
+    finally:
+        span.finish()
+        _current.reset(token)
+        if parent is not None and parent.duration_ns is None:
+            parent.children.append(span)
+        else:
+            # Background work can outlive its parent; keep it under the same id.
+            _record(span)
+
+
+def traced(name: str):
+    """Decorate an async coordinator entity method so each call opens a span."""
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            async with async_span(
+                name,
+                self.coordinator.config_entry.entry_id,
+                entity_id=self.entity_id,
+            ):
+                return await func(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _record(root: Span) -> None:
+    trace = {"trace_id": root.trace_id, **root.as_dict()}
+    routine = root.name in ROUTINE_ROOTS
+    slow = root.duration_ns >= SLOW_TRACE_SECONDS * 1e9
+    if slow:
+        _LOGGER.debug(
+            "Slow %s trace %s took %.1f ms",
+            root.name,
+            root.trace_id,
+            trace["duration_ms"],
+        )
+    if root.entry_id is None:
+        return
+    buffers = _traces.get(root.entry_id)
+    if buffers is None:
+        buffers = _traces[root.entry_id] = {
+            "recent": deque(maxlen=RECENT_TRACES),
+            "slow": deque(maxlen=SLOW_TRACES),
+            "recent_routine": deque(maxlen=RECENT_TRACES),
+            "slow_routine": deque(maxlen=SLOW_TRACES),
+        }
+    buffers["recent_routine" if routine else "recent"].append(trace)
+    if slow:
+        buffers["slow_routine" if routine else "slow"].append(trace)
+
+
+def get_traces(entry_id: str) -> dict[str, list[dict]]:
+    """Return recent and slow traces of an entry, polls listed apart."""
+    buffers = _traces.get(entry_id, {})
+    return {
+        "recent": list(buffers.get("recent", ())),
+        "slow": list(buffers.get("slow", ())),
+        "polls": {
+            "recent": list(buffers.get("recent_routine", ())),
+            "slow": list(buffers.get("slow_routine", ())),
+        },
+    }
+
+
+def clear_traces(entry_id: str) -> None:
+    """Forget the traces of an unloaded entry."""
+    _traces.pop(entry_id, None)
@@ -0,0 +1,68 @@
+"""Raise repair issues for MelView units whose data has gone stale."""
+
+from __future__ import annotations
+
+import logging
+from datetime import timedelta
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import issue_registry as ir
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+CHECK_INTERVAL = timedelta(seconds=60)
+
+
+@callback
+def async_setup_watchdog(
+    hass: HomeAssistant, entry: ConfigEntry, threshold_minutes: int
+) -> None:
+    """Check data age of every unit periodically until the entry unloads."""
+    threshold = threshold_minutes * 60
+    raised: set[str] = set()
+
+    def _issue_id(coordinator) -> str:
+        return f"stale_data_{entry.entry_id}_{coordinator.get_id()}"
+
+    @callback
+    def _async_check(_now=None) -> None:
+        for coordinator in entry.runtime_data:
+            issue_id = _issue_id(coordinator)
+            # Paused units are not polled on purpose.
+            stale = not coordinator.paused and coordinator.watchdog_age() > threshold
+            if stale and issue_id not in raised:
+                _LOGGER.warning(
+                    "No fresh data from %s for over %d minutes",
+                    coordinator.name,
+                    threshold_minutes,
+                )
+                ir.async_create_issue(
+                    hass,
+                    DOMAIN,
+                    issue_id,
+                    is_fixable=False,
+                    severity=ir.IssueSeverity.WARNING,
+                    translation_key="stale_data",
+                    translation_placeholders={
+                        "name": coordinator.get_friendly_name(),
+                        "minutes": str(threshold_minutes),
+                    },
+                )
+                raised.add(issue_id)
+            elif not stale and issue_id in raised:
+                ir.async_delete_issue(hass, DOMAIN, issue_id)
+                raised.discard(issue_id)
+
+    @callback
+    def _async_clear() -> None:
+        for issue_id in raised:
+            ir.async_delete_issue(hass, DOMAIN, issue_id)
+
+    entry.async_on_unload(
+        async_track_time_interval(hass, _async_check, CHECK_INTERVAL)
+    )
+    entry.async_on_unload(_async_clear)
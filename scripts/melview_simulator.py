@@ -0,0 +1,403 @@
+"""Local simulator of the MelView cloud API and Wi-Fi adapter.
+
+Serves ``login.aspx``, ``rooms.aspx``, ``unitcapabilities.aspx`` and
+``unitcommand.aspx`` (including the ``lc`` local command key) under ``/api``,
+plus the adapter ``/smart`` endpoint, for any number of virtual units.
+
+Point the integration at it by passing ``api_url`` to
+``MelViewAuthentication``, e.g. ``http://127.0.0.1:8080/api``. Units report
+``localip`` as the simulator's own host:port so local commands reach ``/smart``.
+
+Example:
+    python scripts/melview_simulator.py --units 2000 --mix ac=6,ducted=3,erv=1 \\
+        --latency lognormal:4.0,0.5 --cookie-ttl 600 --comm-rate 0.01 \\
+        --rate-limit 50
+
+Replay files are JSON lines; each line is one recorded exchange::
+
+    {"endpoint": "unitcommand.aspx", "unitid": 123, "status": 200,
+     "body": {...}, "delay_ms": 85}
+
+``unitid`` is optional. Recorded exchanges for an endpoint/unit are served in
+order (cycling) instead of the synthetic response.
+
+``GET /stats`` returns request counters for the current run.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import secrets
+import time
+from collections import defaultdict
+from itertools import cycle
+
+from aiohttp import web
+
+_LOGGER = logging.getLogger("melview_simulator")
+
+MODE_TEMP_RANGES = {
+    "1": {"min": 10, "max": 31},
+    "2": {"min": 16, "max": 31},
+    "3": {"min": 16, "max": 31},
+    "7": {"min": 16, "max": 31},
+    "8": {"min": 16, "max": 31},
+}
+
+UNIT_TYPES = ("ac", "ducted", "erv")
+
+
+class Latency:
+    """Latency distribution parsed from ``kind:params`` (milliseconds)."""
+
+    def __init__(self, spec: str, rng: random.Random):
+        self._rng = rng
+        kind, _, params = spec.partition(":")
+        values = [float(v) for v in params.split(",") if v]
+        if kind == "none":
+            self._sample = lambda: 0.0
+        elif kind == "fixed":
+            self._sample = lambda: values[0]
+        elif kind == "uniform":
+            self._sample = lambda: rng.uniform(values[0], values[1])
+        elif kind == "normal":
+            self._sample = lambda: max(0.0, rng.gauss(values[0], values[1]))
+        elif kind == "lognormal":
+            self._sample = lambda: rng.lognormvariate(values[0], values[1])
+        else:
+            raise ValueError(f"Unknown latency distribution: {spec}")
+
+    async def async_wait(self):
+        delay = self._sample()
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+
+
+class VirtualUnit:
+    """State of one simulated indoor unit and its adapter."""
+
+    def __init__(self, unitid, building, kind, localip, rng: random.Random):
+        self.unitid = unitid
+        self.building = building
+        self.kind = kind
+        self.room = f"{kind.upper()} {unitid}"
+        self.localip = localip
+        self.comm = False
+        self.state = {
+            "id": str(unitid),
+            "power": rng.choice((0, 1)),
+            "standby": 0,
+            "setmode": 1 if kind == "erv" else rng.choice((1, 2, 3, 7, 8)),
+            "automode": 0,
+            "setfan": rng.choice((2, 3, 5)),
+            "settemp": str(rng.choice(range(18, 27))),
+            "roomtemp": str(round(rng.uniform(15, 28), 1)),
+            "outdoortemp": str(round(rng.uniform(5, 35), 1)),
+            "airdir": 0,
+            "airdirh": 0,
+            "sendcount": 0,
+            "fault": "",
+            "error": "ok",
+        }
+        if kind == "ducted":
+            self.state["zones"] = [
+                {"zoneid": z, "name": f"Zone {z}", "status": rng.choice((0, 1))}
+                for z in range(1, 9)
+            ]
+        if kind == "erv":
+            self.state["exhausttemp"] = str(round(rng.uniform(15, 28), 1))
+            self.state["coreefficiency"] = round(rng.uniform(0.6, 0.9), 2)
+
+    def caps(self):
+        caps = {
+            "id": self.unitid,
+            "unittype": "ERV" if self.kind == "erv" else "RAC",
+            "modeltype": "PAC" if self.kind == "ducted" else "RAC",
+            "modelname": f"SIM-{self.kind.upper()}",
+            "fanstage": 3 if self.kind == "erv" else 5,
+            "hasautofan": 0 if self.kind == "erv" else 1,
+            "halfdeg": 1,
+            "hasoutdoortemp": 1,
+            "localip": self.localip,
+            "error": "ok",
+            "fault": "",
+        }
+        if self.kind != "erv":
+            caps["max"] = MODE_TEMP_RANGES
+        return caps
+
+    def tick(self, rng: random.Random):
+        """Drift room temperature a little on every read."""
+        room = float(self.state["roomtemp"]) + rng.uniform(-0.2, 0.2)
+        self.state["roomtemp"] = str(round(room, 1))
+
+    def apply(self, commands: str):
+        """Apply a comma-separated MelView command string."""
+        for command in commands.split(","):
+            command = command.strip()
+            if command.startswith("PW"):
+                self.state["power"] = int(command[2:])
+            elif command.startswith("MD"):
+                self.state["setmode"] = int(command[2:])
+            elif command.startswith("TS"):
+                self.state["settemp"] = str(float(command[2:]))
+            elif command.startswith("FS"):
+                self.state["setfan"] = int(float(command[2:]))
+            elif command.startswith("Z") and "zones" in self.state:
+                zoneid, status = int(command[1:-1]), int(command[-1])
+                for zone in self.state["zones"]:
+                    if zone["zoneid"] == zoneid:
+                        zone["status"] = status
+            else:
+                raise ValueError(f"Unknown command: {command}")
+        self.state["sendcount"] += 1
+
+    def response(self):
+        state = dict(self.state)
+        if self.comm:
+            state["fault"] = "COMM"
+        return state
+
+
+class Simulator:
+    """In-memory MelView cloud and adapter simulator."""
+
+    def __init__(self, args):
+        self._rng = random.Random(args.seed)
+        self._latency = Latency(args.latency, self._rng)
+        self._cookie_ttl = args.cookie_ttl
+        self._comm_flap = args.comm_flap
+        self._adapter_fail_rate = args.adapter_fail_rate
+        self._rate_limit = args.rate_limit
+        self._password = args.password
+        self._sessions: dict[str, float] = {}
+        self._buckets: dict[str, tuple[float, float]] = {}
+        self._replay: dict[tuple, cycle] = {}
+        self.stats: dict[str, int] = defaultdict(int)
+
+        localip = f"{args.advertise_host or args.host}:{args.port}"
+        weights = dict.fromkeys(UNIT_TYPES, 0)
+        for part in args.mix.split(","):
+            kind, _, weight = part.partition("=")
+            if kind not in weights:
+                raise ValueError(f"Unknown unit type: {kind}")
+            weights[kind] = float(weight)
+        kinds = self._rng.choices(
+            list(weights), weights=list(weights.values()), k=args.units
+        )
+        self.units: dict[int, VirtualUnit] = {}
+        for index, kind in enumerate(kinds):
+            unitid = 100000 + index
+            unit = VirtualUnit(
+                unitid, index // args.units_per_building, kind, localip, self._rng
+            )
+            unit.comm = self._rng.random() < args.comm_rate
+            self.units[unitid] = unit
+
+        if args.replay:
+            self._load_replay(args.replay)
+
+    def _load_replay(self, path):
+        recorded = defaultdict(list)
+        with open(path, encoding="utf-8") as file:
+            for line in file:
+                if line.strip():
+                    exchange = json.loads(line)
+                    key = (exchange["endpoint"], exchange.get("unitid"))
+                    recorded[key].append(exchange)
+        self._replay = {key: cycle(items) for key, items in recorded.items()}
+        _LOGGER.info("Loaded %d recorded exchange keys", len(self._replay))
+
+    async def _replayed(self, endpoint, unitid=None):
+        exchanges = self._replay.get((endpoint, unitid)) or self._replay.get(
+            (endpoint, None)
+        )
+        if exchanges is None:
+            return None
+        exchange = next(exchanges)
+        await asyncio.sleep(exchange.get("delay_ms", 0) / 1000)
+        return web.json_response(exchange.get("body"), status=exchange["status"])
+
+    def _authorise(self, request):
+        """Return an error response if the cookie is missing, expired or throttled."""
+        cookie = request.cookies.get("auth")
+        issued = self._sessions.get(cookie)
+        if issued is None or (
+            self._cookie_ttl and time.monotonic() - issued > self._cookie_ttl
+        ):
+            self.stats["401"] += 1
+            return web.Response(status=401)
+        if self._rate_limit:
+            now = time.monotonic()
+            tokens, last = self._buckets.get(cookie, (self._rate_limit, now))
+            tokens = min(self._rate_limit, tokens + (now - last) * self._rate_limit)
+            if tokens < 1:
+                self._buckets[cookie] = (tokens, now)
+                self.stats["429"] += 1
+                return web.Response(status=429)
+            self._buckets[cookie] = (tokens - 1, now)
+        return None
+
+    async def login(self, request):
+        self.stats["login"] += 1
+        await self._latency.async_wait()
+        body = await request.json()
+        if (replayed := await self._replayed("login.aspx")) is not None:
+            return replayed
+        if self._password is not None and body.get("pass") != self._password:
+            return web.json_response({"error": "invalid login"})
+        cookie = secrets.token_hex(16)
+        self._sessions[cookie] = time.monotonic()
+        response = web.json_response(
+            {"userunits": len(self.units), "userid": 1, "error": "ok"}
+        )
+        response.set_cookie("auth", cookie)
+        return response
+
+    async def rooms(self, request):
+        self.stats["rooms"] += 1
+        await self._latency.async_wait()
+        if (denied := self._authorise(request)) is not None:
+            return denied
+        if (replayed := await self._replayed("rooms.aspx")) is not None:
+            return replayed
+        buildings = defaultdict(list)
+        for unit in self.units.values():
+            buildings[unit.building].append(
+                {"unitid": str(unit.unitid), "room": unit.room}
+            )
+        return web.json_response(
+            [
+                {"buildingid": str(building), "building": f"Building {building}",
+                 "units": units}
+                for building, units in buildings.items()
+            ]
+        )
+
+    async def capabilities(self, request):
+        self.stats["capabilities"] += 1
+        await self._latency.async_wait()
+        if (denied := self._authorise(request)) is not None:
+            return denied
+        unitid = int((await request.json())["unitid"])
+        if (
+            replayed := await self._replayed("unitcapabilities.aspx", unitid)
+        ) is not None:
+            return replayed
+        unit = self.units.get(unitid)
+        if unit is None:
+            return web.Response(status=404)
+        return web.json_response(unit.caps())
+
+    async def command(self, request):
+        await self._latency.async_wait()
+        if (denied := self._authorise(request)) is not None:
+            return denied
+        body = await request.json()
+        unitid = int(body["unitid"])
+        commands = body.get("commands")
+        self.stats["command" if commands else "info"] += 1
+        if (
+            replayed := await self._replayed("unitcommand.aspx", unitid)
+        ) is not None:
+            return replayed
+        unit = self.units.get(unitid)
+        if unit is None:
+            return web.Response(status=404)
+        if self._comm_flap and self._rng.random() < self._comm_flap:
+            unit.comm = not unit.comm
+        if commands:
+            try:
+                unit.apply(commands)
+            except ValueError as err:
+                return web.json_response({"error": str(err)}, status=400)
+        else:
+            unit.tick(self._rng)
+        data = unit.response()
+        if commands and body.get("lc"):
+            data["lc"] = secrets.token_hex(24)
+        return web.json_response(data)
+
+    async def smart(self, request):
+        self.stats["smart"] += 1
+        await self._latency.async_wait()
+        payload = await request.text()
+        if "<ESV>" not in payload:
+            return web.Response(status=400)
+        if self._rng.random() < self._adapter_fail_rate:
+            self.stats["smart_failed"] += 1
+            return web.Response(status=500)
+        return web.Response(text="<ESV>ok</ESV>", content_type="text/xml")
+
+    async def get_stats(self, request):
+        return web.json_response(
+            {"units": len(self.units), "sessions": len(self._sessions), **self.stats}
+        )
+
+    def app(self):
+        app = web.Application()
+        app.add_routes(
+            [
+                web.post("/api/login.aspx", self.login),
+                web.post("/api/rooms.aspx", self.rooms),
+                web.post("/api/unitcapabilities.aspx", self.capabilities),
+                web.post("/api/unitcommand.aspx", self.command),
+                web.post("/smart", self.smart),
+                web.get("/stats", self.get_stats),
+            ]
+        )
+        return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument(
+        "--advertise-host", help="Host reported as the adapter localip"
+    )
+    parser.add_argument("--units", type=int, default=10)
+    parser.add_argument("--units-per-building", type=int, default=50)
+    parser.add_argument(
+        "--mix", default="ac=1", help="Unit type weights, e.g. ac=6,ducted=3,erv=1"
+    )
+    parser.add_argument(
+        "--latency",
+        default="none",
+        help="none | fixed:MS | uniform:LO,HI | normal:MU,SD | lognormal:MU,SIGMA",
+    )
+    parser.add_argument(
+        "--cookie-ttl", type=float, default=0, help="Seconds until cookies 401"
+    )
+    parser.add_argument(
+        "--comm-rate", type=float, default=0.0, help="Fraction of units in COMM fault"
+    )
+    parser.add_argument(
+        "--comm-flap",
+        type=float,
+        default=0.0,
+        help="Probability per request that a unit toggles COMM fault",
+    )
+    parser.add_argument(
+        "--adapter-fail-rate", type=float, default=0.0, help="/smart failure rate"
+    )
+    parser.add_argument(
+        "--rate-limit", type=float, default=0, help="Requests/s per cookie (429 above)"
+    )
+    parser.add_argument("--password", help="Only accept this password")
+    parser.add_argument("--replay", help="JSON lines file of recorded exchanges")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    simulator = Simulator(args)
+    _LOGGER.info("Simulating %d units", len(simulator.units))
+    web.run_app(simulator.app(), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()